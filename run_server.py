@@ -44,6 +44,28 @@ parser.add_argument("--debug", action="store_true", help="Print extra diagnostic
 args = parser.parse_args()
 
 module_str = "backend.app.main"
+
+if args.reload:
+    # uvicorn's reloader imports the app itself (and needs an import string to do so),
+    # so skip the eager import here instead of loading the whole app twice.
+    print(f"Starting server on http://{args.host}:{args.port} (reload=True)")
+    try:
+        uvicorn.run(
+            f"{module_str}:app",
+            host=args.host,
+            port=args.port,
+            reload=True,
+            app_dir=str(SPORTS_DIR),
+            reload_dirs=[str(SPORTS_DIR / "backend")],
+        )
+    except Exception as e:
+        print("Uvicorn failed to start:", e)
+        if args.debug:
+            traceback.print_exc()
+        sys.exit(1)
+    sys.exit(0)
+
+# Non-reload: import eagerly so import errors fail fast with diagnostics
 try:
     mod = importlib.import_module(module_str)
 except Exception as e:
@@ -82,9 +104,9 @@ if args.debug:
     print(f"API_KEY: {masked}")
     print(f"BASE_URL: {base_url}")
 
-print(f"Starting server on http://{args.host}:{args.port} (reload={args.reload})")
+print(f"Starting server on http://{args.host}:{args.port} (reload=False)")
 try:
-    uvicorn.run(app, host=args.host, port=args.port, reload=args.reload)
+    uvicorn.run(app, host=args.host, port=args.port)
 except Exception as e:
     print("Uvicorn failed to start:", e)
     if args.debug:
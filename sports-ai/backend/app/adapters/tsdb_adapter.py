@@ -17,15 +17,10 @@ class TSDBAdapter:
         self.agent = CollectorAgentV2()
 
     def call(self, intent: str, args: Dict[str, Any]) -> Dict[str, Any]:
-        req = {"intent": intent, "args": dict(args or {})}  # defensive copy
-        resp = self.agent.handle(req)
-
-        # Normalize trace to a list and prepend adapter marker
-        inner_meta = (resp.get("meta") or {})
-        trace = list(inner_meta.get("trace") or [])
-        trace.insert(0, {"step": "adapter_in", "provider": "tsdb", "intent": intent})
-
-        out = {
+        # CollectorAgentV2 treats args as read-only, so no defensive copy is needed.
+        resp = self.agent.handle({"intent": intent, "args": args or {}})
+        inner_meta = resp.get("meta") or {}
+        return {
             "ok": bool(resp.get("ok")),
             "intent": resp.get("intent", intent),                 # passthrough for quick logs
             "args_resolved": resp.get("args_resolved"),           # handy for router/UI
@@ -33,7 +28,10 @@ class TSDBAdapter:
             "error": resp.get("error"),
             "meta": {
                 "provider": "tsdb",
-                "trace": trace,
+                # adapter marker first, built in one allocation (no insert(0) shift)
+                "trace": [
+                    {"step": "adapter_in", "provider": "tsdb", "intent": intent},
+                    *(inner_meta.get("trace") or ()),
+                ],
             },
         }
-        return out
\ No newline at end of file
@@ -27,10 +27,31 @@ Response envelope matches existing agents:
 """
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta, timezone
+import heapq
 import math
+import os
+
+try:
+    from ..utils.cache import TTLCache, cached_call, make_key  # type: ignore
+    from ..utils.form import tally_scores  # type: ignore
+except Exception:
+    from backend.app.utils.cache import TTLCache, cached_call, make_key  # type: ignore
+    from backend.app.utils.form import tally_scores  # type: ignore
+
+# Provider response cache TTLs (seconds); 0 disables. Events change quickly when live,
+# recent fixtures a little less, and H2H history hardly at all.
+ANALYSIS_EVENT_TTL = max(float(os.environ.get("ANALYSIS_EVENT_TTL", "5")), 0.0)
+ANALYSIS_FIXTURES_TTL = max(float(os.environ.get("ANALYSIS_FIXTURES_TTL", "30")), 0.0)
+ANALYSIS_H2H_TTL = max(float(os.environ.get("ANALYSIS_H2H_TTL", "300")), 0.0)
+
+# Provider fetches (recent fixtures, H2H) are independent I/O-bound round-trips,
+# so they are fanned out on a shared pool instead of being awaited one by one.
+_FETCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="analysis-fetch")
+
 # ---------------------------- helpers: envelope/trace ----------------------------
 
 def mkresp(ok: bool, intent: str, args: Dict[str, Any], data: Any = None,
@@ -87,9 +108,46 @@ def _pick_event_row_from_data(data: Any, eid: str) -> Optional[Dict[str, Any]]:
         return rows[0]
     return None
 
+# ---------------------------- team ids ----------------------------
+# (home keys, away keys) in lookup order. Rows can carry several of these keys with
+# different values (AllSports vs normalized shapes), so each caller keeps the order it
+# has always used: the first present key decides which id is compared.
+_TEAM_ID_KEYS = (
+    ("event_home_team_id", "home_team_id", "home_team_key", "homeTeamId", "home_id"),
+    ("event_away_team_id", "away_team_id", "away_team_key", "awayTeamId", "away_id"),
+)
+# _is_same_orientation (win probability) prefers homeTeamId over home_team_key
+_ORIENTATION_ID_KEYS = (
+    ("event_home_team_id", "home_team_id", "homeTeamId", "home_team_key", "home_id"),
+    ("event_away_team_id", "away_team_id", "awayTeamId", "away_team_key", "away_id"),
+)
+# _intent_h2h prefers the normalized homeTeamId/home_team_key before home_team_id
+_H2H_ID_KEYS = (
+    ("event_home_team_id", "homeTeamId", "home_team_key", "home_team_id", "home_id"),
+    ("event_away_team_id", "awayTeamId", "away_team_key", "away_team_id", "away_id"),
+)
+
+def _first_present(row: Dict[str, Any], keys: Tuple[str, ...]) -> str:
+    """First truthy value among `keys` as str ("" when none)."""
+    get = row.get
+    for k in keys:
+        if (v := get(k)):
+            return str(v)
+    return ""
+
+def _team_ids(row: Dict[str, Any], keys: Tuple[Tuple[str, ...], Tuple[str, ...]] = _TEAM_ID_KEYS) -> Tuple[str, str]:
+    """(home_id, away_id) of a fixture row across provider shapes, using `keys` lookup order."""
+    return _first_present(row, keys[0]), _first_present(row, keys[1])
+
+def _fixture_dt_key(m: Dict[str, Any]) -> str:
+    """Sortable "date time" string for a fixture row."""
+    d = str(m.get("event_date") or m.get("match_date") or m.get("date") or "")
+    t = str(m.get("event_time") or m.get("match_time") or m.get("time") or "")
+    return f"{d} {t}".strip()
+
 # ---------------------------- data shapes ----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class EventInfo:
     event_id: str
     league_id: Optional[str]
@@ -118,6 +176,7 @@ class AnalysisAgent:
         # NOTE: tsdb_agent is ignored (kept only for backward compatibility).
         self.sports = all_sports_agent
         self.log = logger
+        self._cache = TTLCache(maxsize=512)
 
     # --------------- public entry ---------------
 
@@ -159,10 +218,16 @@ class AnalysisAgent:
                 return mkresp(True, intent, {"eventId": ev.event_id, "lookback": lookback}, data=data, trace=trace, fallback=src)
 
             if intent == "analysis.match_insights":
+                # Prefetch H2H rows as soon as team ids are known; they overlap the form
+                # fetches and are then shared by the h2h section and the winprob estimator.
+                h2h_fut = _FETCH_POOL.submit(self._h2h_matches, ev.home_team_id, ev.away_team_id, 10)
                 form_data, t1 = self._intent_form(ev, lookback=5)
-                h2h_data, t2 = self._intent_h2h(ev, lookback=10)
-                wp_data, t3 = self._intent_winprob(ev)
-                trace.extend(t1 + t2 + t3)
+                h2h_rows, t2 = h2h_fut.result()
+                t2.append({"step": "h2h.prefetch", "rows": len(h2h_rows)})
+                core_memo: Dict[Any, Any] = {}  # both consumers read the same rows
+                h2h_data, t3 = self._intent_h2h(ev, lookback=10, h2h_rows=h2h_rows, core_memo=core_memo)
+                wp_data, t4 = self._intent_winprob(ev, h2h_rows=h2h_rows, core_memo=core_memo, form_data=form_data)
+                trace.extend(t1 + t2 + t3 + t4)
                 return mkresp(
                     True, intent, {"eventId": ev.event_id},
                     data={"winprob": wp_data, "form": form_data, "h2h": h2h_data,
@@ -180,6 +245,17 @@ class AnalysisAgent:
 
     # --------------- data resolution ---------------
 
+    def _sports_call(self, intent: str, args: Dict[str, Any], ttl: float) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        self.sports.handle behind the per-agent TTL cache.
+        Returns (response, cache_state) with cache_state in {None, "hit", "stale"}.
+        """
+        return cached_call(
+            self._cache, make_key(intent, args), ttl,
+            lambda: self.sports.handle({"intent": intent, "args": args}),
+            is_ok=lambda r: bool(r and r.get("ok")),
+        )
+
     def _resolve_event(self, event_id: str) -> Tuple[Optional[EventInfo], Optional[str], List[Any]]:
         """
         Resolve event using AllSports only.
@@ -190,8 +266,8 @@ class AnalysisAgent:
         # AllSportsRawAgent: event.get (met=Fixtures with eventId/matchId)
         if self.sports:
             try:
-                r = self.sports.handle({"intent": "event.get", "args": {"eventId": event_id, "matchId": event_id}})
-                trace.append({"step": "sports.event.get", "ok": r.get("ok"), "raw_meta": r.get("meta")})
+                r, cached = self._sports_call("event.get", {"eventId": event_id, "matchId": event_id}, ANALYSIS_EVENT_TTL)
+                trace.append({"step": "sports.event.get", "ok": r.get("ok"), "cached": cached, "raw_meta": r.get("meta")})
                 ev = self._extract_event_from_provider(r, expected_id=event_id)
                 if ev:
                     return ev, "allsports", trace
@@ -224,22 +300,7 @@ class AnalysisAgent:
         if not eid:
             return None
 
-        home_id = str(
-            obj.get("event_home_team_id")
-            or obj.get("home_team_id")
-            or obj.get("home_team_key")
-            or obj.get("homeTeamId")
-            or obj.get("home_id")
-            or ""
-        ).strip()
-        away_id = str(
-            obj.get("event_away_team_id")
-            or obj.get("away_team_id")
-            or obj.get("away_team_key")
-            or obj.get("awayTeamId")
-            or obj.get("away_id")
-            or ""
-        ).strip()
+        home_id, away_id = (x.strip() for x in _team_ids(obj))
 
         home_name = obj.get("event_home_team") or obj.get("homeTeam") or obj.get("home_team") or None
         away_name = obj.get("event_away_team") or obj.get("awayTeam") or obj.get("away_team") or None
@@ -328,29 +389,17 @@ class AnalysisAgent:
         return "D"
 
     def _is_same_orientation(self, row: Dict[str, Any], home_id: str, away_id: str,
-                             home_name: Optional[str], away_name: Optional[str]) -> Optional[bool]:
+                             home_name: Optional[str], away_name: Optional[str],
+                             row_ids: Optional[Tuple[str, str]] = None) -> Optional[bool]:
         """
         True  -> historical row has same (home, away) orientation as current event
         False -> reversed orientation
         None  -> cannot determine
+        row_ids: the row's (home_id, away_id) when the caller already extracted them
+        (with _ORIENTATION_ID_KEYS).
         """
         # Prefer IDs
-        cand_home = str(
-            row.get("event_home_team_id")
-            or row.get("home_team_id")
-            or row.get("homeTeamId")
-            or row.get("home_team_key")
-            or row.get("home_id")
-            or ""
-        )
-        cand_away = str(
-            row.get("event_away_team_id")
-            or row.get("away_team_id")
-            or row.get("awayTeamId")
-            or row.get("away_team_key")
-            or row.get("away_id")
-            or ""
-        )
+        cand_home, cand_away = row_ids if row_ids is not None else _team_ids(row, _ORIENTATION_ID_KEYS)
         if cand_home and cand_away and home_id and away_id:
             if cand_home == str(home_id) and cand_away == str(away_id):
                 return True
@@ -370,12 +419,18 @@ class AnalysisAgent:
 
         return None
 
-    def _intent_winprob(self, ev: EventInfo, args: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], List[Any]]:
+    def _intent_winprob(self, ev: EventInfo, args: Optional[Dict[str, Any]] = None,
+                        h2h_rows: Optional[List[Dict[str, Any]]] = None,
+                        core_memo: Optional[Dict[Any, Any]] = None,
+                        form_data: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], List[Any]]:
         """
         Win probability with H2H-driven estimator (Dirichlet with recency & venue weighting) as default.
         Fallbacks: odds-implied, then form-based.
         You can force a source via args['source'] in {'h2h','odds','form','auto'}.
         Tunables (args): lookback:int=10, half_life:float=4.0, venue_weight:float=1.25
+        h2h_rows: already fetched newest-first H2H rows (fetched with at least this lookback).
+        core_memo: request-scoped _match_core memo shared with other consumers of h2h_rows.
+        form_data: an already computed _intent_form(ev, lookback=5) result for the form fallback.
         """
         args = args or {}
         trace: List[Any] = []
@@ -388,19 +443,24 @@ class AnalysisAgent:
 
         def _res_h2h() -> Tuple[Optional[Dict[str, Any]], List[Any]]:
             tlocal: List[Any] = []
-            rows, t = self._h2h_matches(ev.home_team_id, ev.away_team_id, lookback)
-            tlocal.extend(t)
+            if h2h_rows is not None:
+                rows = h2h_rows[:lookback]
+                tlocal.append({"step": "h2h", "prefetched": True})
+            else:
+                rows, t = self._h2h_matches(ev.home_team_id, ev.away_team_id, lookback)
+                tlocal.extend(t)
             if not rows:
                 tlocal.append({"step": "h2h", "note": "no rows"})
                 return None, tlocal
             wH = wD = wA = 0.0
             used = 0
             for idx, row in enumerate(rows):
-                sc = _scoreline(row)
+                sc, rh, ra = _match_core(row, core_memo, _ORIENTATION_ID_KEYS)
                 if sc is None:
                     continue
                 hg, ag = sc
-                same = self._is_same_orientation(row, ev.home_team_id, ev.away_team_id, ev.home_team_name, ev.away_team_name)
+                same = self._is_same_orientation(row, ev.home_team_id, ev.away_team_id, ev.home_team_name, ev.away_team_name,
+                                                 row_ids=(rh, ra))
                 if same is False:
                     who = self._who_won_from_score(hg, ag)
                     oriented = "D" if who == "D" else ("H" if who == "A" else "A")
@@ -462,14 +522,16 @@ class AnalysisAgent:
             return None, tlocal
 
         def _res_form() -> Tuple[Dict[str, Any], List[Any]]:
-            form, t = self._intent_form(ev, lookback=5)
+            if form_data is not None:
+                form, t = form_data, [{"step": "form", "reused": True}]
+            else:
+                form, t = self._intent_form(ev, lookback=5)
             home = form["home_metrics"]; away = form["away_metrics"]
             home_rating = (home["ppg"] * 1.0) + (home["gd_per_game"] * 0.35) + (home["streak_bonus"])
             away_rating = (away["ppg"] * 1.0) + (away["gd_per_game"] * 0.35) + (away["streak_bonus"])
-            hfa = 0.20
-            rating_diff = (home_rating + hfa) - away_rating
-            p_home = 1 / (1 + math.exp(-rating_diff))
-            p_away = 1 - p_home
+            rating_diff = (home_rating + _FORM_HOME_ADVANTAGE) - away_rating
+            p_home = _logistic(rating_diff)
+            p_away = 1 - p_home  # logistic symmetry: no second exp() needed
             closeness = 1 - abs(0.5 - p_home) * 2
             p_draw = 0.22 + 0.2 * closeness
             s = p_home + p_draw + p_away
@@ -518,14 +580,8 @@ class AnalysisAgent:
     # --------------- intent: recent form ---------------
 
     def _intent_form(self, ev: EventInfo, lookback: int = 5) -> Tuple[Dict[str, Any], List[Any]]:
-        trace: List[Any] = []
-        # Fetch recent finished matches for both teams (provider-first strategy)
-        h_matches, t1 = self._recent_matches(ev.home_team_id, lookback)
-        a_matches, t2 = self._recent_matches(ev.away_team_id, lookback)
-        trace.extend(t1 + t2)
-
-        h_metrics = form_metrics_from_matches(h_matches, ev.home_team_id)
-        a_metrics = form_metrics_from_matches(a_matches, ev.away_team_id)
+        # Recent finished matches for both teams, fetched concurrently (provider-first strategy)
+        (h_metrics, a_metrics), trace = self.team_form_many([ev.home_team_id, ev.away_team_id], lookback)
 
         # Build short summary strings
         def _summary(m):
@@ -547,49 +603,44 @@ class AnalysisAgent:
         }
         return data, trace
 
+    def team_form_many(self, team_ids: List[str], lookback: int = 5) -> Tuple[List[Dict[str, Any]], List[Any]]:
+        """
+        Form metrics for several teams at once (e.g. every team playing today).
+        Recent fixtures are fetched concurrently; metrics come back in team_ids order.
+        """
+        futures = [_FETCH_POOL.submit(self._recent_matches, tid, lookback) for tid in team_ids]
+        trace: List[Any] = []
+        metrics: List[Dict[str, Any]] = []
+        for tid, fut in zip(team_ids, futures):
+            matches, t = fut.result()
+            trace.extend(t)
+            metrics.append(form_metrics_from_matches(matches, tid))
+        return metrics, trace
+
     # --------------- intent: head-to-head ---------------
 
-    def _intent_h2h(self, ev: EventInfo, lookback: int = 10) -> Tuple[Dict[str, Any], List[Any]]:
+    def _intent_h2h(self, ev: EventInfo, lookback: int = 10,
+                    h2h_rows: Optional[List[Dict[str, Any]]] = None,
+                    core_memo: Optional[Dict[Any, Any]] = None) -> Tuple[Dict[str, Any], List[Any]]:
         trace: List[Any] = []
-        matches, t = self._h2h_matches(ev.home_team_id, ev.away_team_id, lookback)
-        trace.extend(t)
+        if h2h_rows is not None:
+            matches = h2h_rows[:lookback]
+        else:
+            matches, t = self._h2h_matches(ev.home_team_id, ev.away_team_id, lookback)
+            trace.extend(t)
 
-        w_h = w_a = d = 0
-        goals_h = goals_a = 0
+        # Orient every scored row as (current home goals, current away goals)
+        oriented: List[Tuple[int, int]] = []
         for m in matches:
-            s = _scoreline(m)
+            # score + which side is homeTeam in the record, in one pass
+            s, mh, ma = _match_core(m, core_memo, _H2H_ID_KEYS)
             if s is None:
                 continue
             h, a = s
-            # determine which side is homeTeam in the record
-            mh = str(
-                m.get("event_home_team_id")
-                or m.get("homeTeamId")
-                or m.get("home_team_key")
-                or m.get("home_team_id")
-                or m.get("home_id")
-                or ""
-            )
-            ma = str(
-                m.get("event_away_team_id")
-                or m.get("awayTeamId")
-                or m.get("away_team_key")
-                or m.get("away_team_id")
-                or m.get("away_id")
-                or ""
-            )
-            if mh == ev.home_team_id and ma == ev.away_team_id:
-                # aligned
-                goals_h += h; goals_a += a
-                if h > a: w_h += 1
-                elif a > h: w_a += 1
-                else: d += 1
-            else:
-                # If inverted, flip goals
-                goals_h += a; goals_a += h
-                if a > h: w_h += 1
-                elif h > a: w_a += 1
-                else: d += 1
+            # aligned as-is, otherwise flip goals
+            oriented.append((h, a) if mh == ev.home_team_id and ma == ev.away_team_id else (a, h))
+
+        w_h, d, w_a, goals_h, goals_a = tally_scores(oriented)
 
         data = {
             "eventId": ev.event_id,
@@ -616,8 +667,8 @@ class AnalysisAgent:
                     "from": start_dt.strftime("%Y-%m-%d"),
                     "to": end_dt.strftime("%Y-%m-%d"),
                 }
-                r = self.sports.handle({"intent": "fixtures.list", "args": args})
-                trace.append({"step": "sports.fixtures.list", "ok": r.get("ok"), "args": args})
+                r, cached = self._sports_call("fixtures.list", args, ANALYSIS_FIXTURES_TTL)
+                trace.append({"step": "sports.fixtures.list", "ok": r.get("ok"), "cached": cached, "args": args})
                 if r.get("ok"):
                     data = r.get("data") or {}
                     arr = data.get("result") if isinstance(data, dict) else data
@@ -635,13 +686,8 @@ class AnalysisAgent:
                         fr = m.get("event_final_result") or m.get("final_score") or m.get("score")
                         return isinstance(fr, str) and "-" in fr
 
-                    def dt_key(m: Dict[str, Any]) -> str:
-                        d = str(m.get("event_date") or m.get("match_date") or m.get("date") or "")
-                        t = str(m.get("event_time") or m.get("match_time") or m.get("time") or "")
-                        return f"{d} {t}".strip()
-
                     finished = [m for m in matches if is_finished(m)]
-                    finished.sort(key=dt_key)  # oldest -> newest
+                    finished.sort(key=_fixture_dt_key)  # oldest -> newest
                     return finished[-lookback:], trace
             except Exception as e:
                 trace.append({"step": "sports.fixtures.list", "error": str(e)})
@@ -675,39 +721,15 @@ class AnalysisAgent:
             except Exception:
                 return False
 
-        def _ids_from_row(row: Dict[str, Any]) -> Tuple[str, str]:
-            h = str(
-                row.get("event_home_team_id")
-                or row.get("home_team_id")
-                or row.get("home_team_key")
-                or row.get("homeTeamId")
-                or row.get("home_id")
-                or ""
-            )
-            a = str(
-                row.get("event_away_team_id")
-                or row.get("away_team_id")
-                or row.get("away_team_key")
-                or row.get("awayTeamId")
-                or row.get("away_id")
-                or ""
-            )
-            return h, a
-
         def _is_pair_row(row: Dict[str, Any], ta: str, tb: str) -> bool:
-            h, a = _ids_from_row(row)
+            h, a = _team_ids(row)
             return (h == ta and a == tb) or (h == tb and a == ta)
 
-        def _dt_key(m: Dict[str, Any]) -> str:
-            d = str(m.get("event_date") or m.get("match_date") or m.get("date") or "")
-            t = str(m.get("event_time") or m.get("match_time") or m.get("time") or "")
-            return f"{d} {t}".strip()
-
         # ---------- Provider path (preferred) ----------
         if self.sports:
             try:
-                r = self.sports.handle({"intent": "h2h", "args": {"h2h": f"{team_a}-{team_b}"}})
-                trace.append({"step": "sports.h2h", "ok": r.get("ok")})
+                r, cached = self._sports_call("h2h", {"h2h": f"{team_a}-{team_b}"}, ANALYSIS_H2H_TTL)
+                trace.append({"step": "sports.h2h", "ok": r.get("ok"), "cached": cached})
                 if r.get("ok"):
                     data = r.get("data") or {}
                     matches: List[Dict[str, Any]] = []
@@ -735,13 +757,12 @@ class AnalysisAgent:
                     if matches:
                         matches = [m for m in matches if _finished(m)]
 
-                    # Sort newest -> oldest and clip lookback
+                    # Newest -> oldest, clipped to lookback (top-k, no full sort)
                     if matches:
                         try:
-                            matches.sort(key=_dt_key, reverse=True)
+                            return heapq.nlargest(lookback, matches, key=_fixture_dt_key), trace
                         except Exception:
-                            pass
-                        return matches[:lookback], trace
+                            return matches[:lookback], trace
             except Exception as e:
                 trace.append({"step": "sports.h2h", "error": str(e)})
 
@@ -752,16 +773,15 @@ class AnalysisAgent:
 
         out: List[Dict[str, Any]] = []
         for m in a_list:
-            h, a = _ids_from_row(m)
+            h, a = _team_ids(m)
             if ((h == team_a and a == team_b) or (h == team_b and a == team_a)) and _finished(m):
                 out.append(m)
 
         if out:
             try:
-                out.sort(key=_dt_key, reverse=True)
+                out = heapq.nlargest(lookback, out, key=_fixture_dt_key)
             except Exception:
-                pass
-            out = out[:lookback]
+                out = out[:lookback]
 
         return out, trace
 
@@ -777,6 +797,15 @@ def _safe_float(x) -> Optional[float]:
     except Exception:
         return None
 
+_FORM_HOME_ADVANTAGE = 0.20  # rating bonus for the home side in the form-based fallback
+
+def _logistic(x: float) -> float:
+    """1 / (1 + e^-x), written so that large |x| cannot overflow exp()."""
+    if x >= 0:
+        return 1.0 / (1.0 + math.exp(-x))
+    z = math.exp(x)
+    return z / (1.0 + z)
+
 def implied_probs_from_decimal_odds(odds: Dict[str, float]) -> Dict[str, float]:
     """
     Basic inverse-odds normalization to remove overround.
@@ -787,24 +816,27 @@ def implied_probs_from_decimal_odds(odds: Dict[str, float]) -> Dict[str, float]:
     s = inv_h + inv_d + inv_a
     return {"home": inv_h / s, "draw": inv_d / s, "away": inv_a / s}
 
+_SCORE_KEY_PAIRS = (
+    ("home_team_goal","away_team_goal"),
+    ("home_score","away_score"),
+    ("goals_home","goals_away"),
+    ("event_final_result_home","event_final_result_away"),
+    ("homeGoals","awayGoals"),
+    ("home","away"),
+)
+
 def _scoreline(match: Dict[str, Any]) -> Optional[Tuple[int,int]]:
     # Common fields
-    for hk, ak in (
-        ("home_team_goal","away_team_goal"),
-        ("home_score","away_score"),
-        ("goals_home","goals_away"),
-        ("event_final_result_home","event_final_result_away"),
-        ("homeGoals","awayGoals"),
-        ("home","away"),
-    ):
-        h = match.get(hk); a = match.get(ak)
+    get = match.get
+    for hk, ak in _SCORE_KEY_PAIRS:
+        h = get(hk); a = get(ak)
         try:
             if h is not None and a is not None:
                 return int(h), int(a)
         except Exception:
             continue
     # Sometimes a single string like "2 - 1"
-    s = match.get("final_score") or match.get("event_final_result") or match.get("score")
+    s = get("final_score") or get("event_final_result") or get("score")
     if isinstance(s, str) and "-" in s:
         try:
             left, right = s.replace(" ", "").split("-")
@@ -813,10 +845,38 @@ def _scoreline(match: Dict[str, Any]) -> Optional[Tuple[int,int]]:
             return None
     return None
 
+_MatchCore = Tuple[Optional[Tuple[int, int]], str, str]
+_MISSING_SCORE = object()  # memo sentinel: a None scoreline is a valid cached value
+
+def _match_core(match: Dict[str, Any], memo: Optional[Dict[Any, Any]] = None,
+                keys: Tuple[Tuple[str, ...], Tuple[str, ...]] = _TEAM_ID_KEYS) -> _MatchCore:
+    """
+    (scoreline, home_id, away_id) extracted once per fixture row; ids are skipped for unscored rows.
+    keys: id lookup order (see _TEAM_ID_KEYS); consumers with different orders share the scoreline.
+    memo: request-scoped cache keyed by row identity, for rows read by several consumers.
+    Rows must stay referenced while the memo is in use (ids are only unique among live objects).
+    """
+    mkey = (id(match), id(keys))
+    if memo is not None:
+        hit = memo.get(mkey)
+        if hit is not None:
+            return hit
+        sc = memo.get(id(match), _MISSING_SCORE)
+        if sc is _MISSING_SCORE:
+            sc = memo[id(match)] = _scoreline(match)
+    else:
+        sc = _scoreline(match)
+    if sc is None:
+        core: _MatchCore = (None, "", "")
+    else:
+        home_id, away_id = _team_ids(match, keys)
+        core = (sc, home_id, away_id)
+    if memo is not None:
+        memo[mkey] = core
+    return core
+
 def form_metrics_from_matches(matches: List[Dict[str, Any]], team_id: str) -> Dict[str, Any]:
-    games = 0; wins = draws = losses = 0
-    gf = ga = 0
-    last_results: List[str] = []  # newest first, values "W","D","L"
+    pairs: List[Tuple[int, int]] = []  # (goals for, goals against), in match order
 
     for m in matches:
         s = _scoreline(m)
@@ -829,20 +889,14 @@ def form_metrics_from_matches(matches: List[Dict[str, Any]], team_id: str) -> Di
             continue
 
         if mh == team_id:
-            gf += h; ga += a
-            res = "W" if h > a else ("D" if h == a else "L")
+            pairs.append((h, a))
         elif ma == team_id:
-            gf += a; ga += h
-            res = "W" if a > h else ("D" if a == h else "L")
-        else:
-            # not this team (filter noise)
-            continue
+            pairs.append((a, h))
+        # else: not this team (filter noise)
 
-        games += 1
-        last_results.append(res)
-        if res == "W": wins += 1
-        elif res == "D": draws += 1
-        else: losses += 1
+    games = len(pairs)
+    wins, draws, losses, gf, ga = tally_scores(pairs)
+    last_results = ["W" if f > a else ("D" if f == a else "L") for f, a in pairs]
 
     ppg = (wins*3 + draws*1) / games if games else 0.0
     gd = gf - ga
@@ -1,5 +1,9 @@
 
-from typing import Any, Dict, Tuple, List
+import asyncio, os, threading
+from datetime import datetime, timezone
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Tuple, List
 # Try relative import first (normal package layout). Fallback to absolute if executed differently.
 try:  # pragma: no cover - import robustness
     from ..utils.http_client import get_json  # type: ignore
@@ -9,15 +13,332 @@ except Exception:  # noqa: blanket ok here
     except Exception as _e:  # final fallback
         raise ImportError("Cannot import get_json from utils.http_client") from _e
 
-# Optional AllSports API client import.  This provides a secondary
-# datasource so the collector can fall back if TheSportsDB is unavailable.
+# Optional AllSports API client.  This provides a secondary datasource so the
+# collector can fall back if TheSportsDB is unavailable.  It is imported lazily on
+# the first fallback: collector_agent pulls in requests/joblib, which TSDB-only
+# paths never need.
+_MISSING = object()
+_allsports_client: Any = _MISSING
+
+
+def _get_allsports() -> Any:
+    global _allsports_client
+    if _allsports_client is _MISSING:
+        try:  # pragma: no cover - import robustness
+            from .collector_agent import allsports_client as client  # type: ignore
+        except Exception:  # noqa: blanket ok here
+            try:
+                from backend.app.agents.collector_agent import allsports_client as client  # type: ignore
+            except Exception:  # If even this fails we operate without the fallback.
+                client = None
+        _allsports_client = client
+    return _allsports_client
+
+try:  # optional: C-accelerated similarity scoring for the fuzzy league fallback
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process
+except ImportError:  # pragma: no cover - fallback when library missing
+    _rf_fuzz = _rf_process = None  # type: ignore[assignment]
+
 try:  # pragma: no cover - import robustness
-    from .collector_agent import allsports_client  # type: ignore
+    from ..utils.cache import DiskCache, TTLCache, cached_call, make_key  # type: ignore
+    from ..utils.rate_limit import FailureBudget, TokenBucket  # type: ignore
 except Exception:  # noqa: blanket ok here
+    from backend.app.utils.cache import DiskCache, TTLCache, cached_call, make_key  # type: ignore
+    from backend.app.utils.rate_limit import FailureBudget, TokenBucket  # type: ignore
+
+# In-process response cache for TheSportsDB GETs, shared by all collector instances.
+# TSDB_HTTP_TTL is the default TTL in seconds (0 disables caching); reference
+# endpoints that barely change get longer TTLs.
+TSDB_HTTP_TTL = max(float(os.environ.get("TSDB_HTTP_TTL", "60")), 0.0)
+_HTTP_PATH_TTL: Dict[str, float] = {
+    "/all_sports.php": 86400,
+    "/all_countries.php": 86400,
+    "/all_leagues.php": 3600,
+    "/search_all_leagues.php": 3600,
+    "/search_all_seasons.php": 3600,
+    "/lookup_all_teams.php": 3600,
+    "/lookup_all_players.php": 3600,  # squads change on transfer-window timescales
+    # id -> entity lookups are pure functions of the id
+    "/lookupleague.php": 900,
+    "/lookupteam.php": 900,
+    "/lookupplayer.php": 900,
+    "/lookupvenue.php": 3600,
+    "/lookupequipment.php": 3600,
+}
+_HTTP_CACHE = TTLCache(maxsize=1024)
+# Optional restart-proof layer for the long-lived reference endpoints above: set
+# TSDB_DISK_CACHE to a SQLite file path to enable it.
+_DISK_MIN_TTL = 3600
+_DISK_CACHE: DiskCache | None = None
+if os.environ.get("TSDB_DISK_CACHE"):
+    try:
+        _DISK_CACHE = DiskCache(os.environ["TSDB_DISK_CACHE"])
+    except Exception:  # unwritable path etc. -> memory-only caching
+        _DISK_CACHE = None
+# name <-> id resolutions are stable, so they outlive the raw responses above.
+TSDB_RESOLVE_TTL = max(float(os.environ.get("TSDB_RESOLVE_TTL", "3600")), 0.0)
+_RESOLVE_CACHE = TTLCache(maxsize=2048)
+# Pacing for real upstream calls (cache hits are free): TSDB_RATE_PER_SEC average,
+# TSDB_RATE_BURST back-to-back; a rate of 0 disables pacing.
+_RATE = TokenBucket(
+    max(float(os.environ.get("TSDB_RATE_PER_SEC", "5")), 0.0),
+    max(float(os.environ.get("TSDB_RATE_BURST", "10")), 1.0),
+)
+# Upstream failures (transport errors, 429, 5xx) tolerated back-to-back before calls
+# fail fast with {"error": "upstream_degraded"} (stale cache entries still serve); 0 disables.
+_FAILURES = FailureBudget(max(float(os.environ.get("TSDB_FAILURE_BUDGET", "10")), 0.0))
+# Independent GETs issued by a single capability (e.g. event expansions) run here.
+_HTTP_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tsdb-http")
+# handle_batch sub-requests get their own pool so they never wait on _HTTP_POOL slots they occupy.
+_BATCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tsdb-batch")
+# Identical GETs already on the wire: later callers wait for the first one's result.
+_INFLIGHT: Dict[bytes, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def clear_caches() -> None:
+    """Drop every cached TSDB response and resolver result (admin hook, e.g. after an upstream fix)."""
+    _HTTP_CACHE.clear()
+    _RESOLVE_CACHE.clear()
+    if _DISK_CACHE is not None:
+        _DISK_CACHE.clear()
+
+
+def _http_ttl(path: str) -> float:
+    if TSDB_HTTP_TTL <= 0:
+        return 0.0
+    return _HTTP_PATH_TTL.get(path, TSDB_HTTP_TTL)
+
+
+# events.list selectors that map one arg straight onto an endpoint, in priority order:
+# (arg, path, query param, extra params, payload key).
+_EVENTS_BY_ARG: Tuple[Tuple[str, str, str, Dict[str, str], str], ...] = (
+    ("date", "/eventsday.php", "d", {"s": "Soccer"}, "events"),
+    ("eventName", "/searchevents.php", "e", {}, "event"),
+)
+# events.list by league/team id: kind -> (resolved kind, path, payload key); None is the default.
+_EVENTS_BY_KIND: Dict[str, Dict[Any, Tuple[str, str, str]]] = {
+    "league": {
+        "next": ("next", "/eventsnextleague.php", "events"),
+        None: ("past", "/eventspastleague.php", "events"),
+    },
+    "team": {
+        "next": ("next", "/eventsnext.php", "events"),
+        None: ("last", "/eventslast.php", "results"),
+    },
+}
+# event.get expansions: (expand name, endpoint, payload keys in preference order).
+_EVENT_EXPANSIONS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ("timeline", "/lookuptimeline.php", ("timeline",)),
+    ("stats", "/lookupeventstats.php", ("eventstats",)),
+    ("lineup", "/lookuplineup.php", ("lineup",)),
+    ("tv", "/lookuptv.php", ("tvchannels", "tv")),
+)
+
+
+def _is_upstream_failure(data: Any) -> bool:
+    """Errors that say the upstream is struggling (not e.g. a 404 for a bad id)."""
+    err = data.get("error") if isinstance(data, dict) else None
+    if not isinstance(err, str):
+        return False
+    if err.startswith("status_"):
+        return err == "status_429" or err.startswith("status_5")
+    return True  # transport error (timeout, connection refused, ...)
+
+
+# Expansions that cannot have data yet. Only a called-off match or a future dateEvent counts:
+# TheSportsDB often leaves played fixtures on a stale "Not Started" status, so the status
+# alone is not trusted. TV listings exist ahead of kick-off and are always fetched.
+_NO_MATCH_DATA = frozenset({"timeline", "stats", "lineup"})
+_CALLED_OFF_STATUSES = frozenset({"postponed", "cancelled", "canceled"})
+
+
+def _expansions_without_data(ev: Dict[str, Any]) -> frozenset:
+    """Expansion names that are known to be empty for this event (nothing to fetch)."""
+    if _lnorm(ev, "strStatus") in _CALLED_OFF_STATUSES:
+        return _NO_MATCH_DATA
+    date = str(ev.get("dateEvent") or "").strip()
+    if date and date > datetime.now(timezone.utc).date().isoformat():
+        return _NO_MATCH_DATA
+    return frozenset()
+
+
+def _paced_get_json(path: str, params: dict) -> dict:
+    if not _FAILURES.allow():
+        return {"error": "upstream_degraded"}
+    _RATE.acquire()
+    data = get_json(path, params)
+    _FAILURES.record(not _is_upstream_failure(data))
+    # AIMD: back off hard when the provider says we're too fast, recover gradually
+    if isinstance(data, dict) and data.get("error") == "status_429":
+        _RATE.penalize()
+    else:
+        _RATE.reward()
+    return data
+
+
+def _fetch_json(path: str, params: dict, key: bytes, ttl: float) -> dict:
+    """Disk layer (reference endpoints only) in front of the single-flight network call."""
+    disk = _DISK_CACHE if ttl >= _DISK_MIN_TTL else None
+    if disk is not None:
+        try:
+            hit, data = disk.get(key)
+            if hit:
+                return data
+        except Exception:
+            pass
+    data = _single_flight(key, lambda: _paced_get_json(path, params))
+    if disk is not None and data and "error" not in data:
+        try:
+            disk.set(key, data, ttl)
+        except Exception:
+            pass
+    return data
+
+
+def _single_flight(key: bytes, fn):
+    """Run fn once per key at a time; concurrent callers with the same key share its result."""
+    with _INFLIGHT_LOCK:
+        fut = _INFLIGHT.get(key)
+        owner = fut is None
+        if owner:
+            fut = _INFLIGHT[key] = Future()
+    if not owner:
+        return fut.result()
     try:
-        from backend.app.agents.collector_agent import allsports_client  # type: ignore
-    except Exception:  # If even this fails we operate without the fallback.
-        allsports_client = None
+        result = fn()
+    except BaseException as e:
+        fut.set_exception(e)
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+
+def _norm(s: str | None) -> str:
+    """Case/whitespace-insensitive form used for all name matching."""
+    return (s or "").strip().lower()
+
+
+def _first_row(data: Dict[str, Any], key: str) -> Any:
+    """First element of data[key], or None when the list is missing/empty."""
+    rows = data.get(key)
+    return rows[0] if rows else None
+
+
+def _lnorm(d: Dict[str, Any], key: str) -> str:
+    """_norm(d.get(key)) without the intermediate `or ""` string."""
+    v = d.get(key)
+    return v.strip().lower() if v else ""
+
+
+_STRINGIFY_IDS = frozenset({"teamId", "leagueId", "playerId", "venueId", "eventId"})
+
+
+def _pick_resolved(args: Dict[str, Any], *keys: str) -> Dict[str, Any]:
+    """Echo the truthy `keys` of args for the `resolved` payload (id fields as str)."""
+    return {k: (str(args[k]) if k in _STRINGIFY_IDS else args[k]) for k in keys if args.get(k)}
+
+
+def _str_list(value: Any, arg: str) -> List[str]:
+    """A list-of-strings arg that may also arrive as "a,b"; anything else is BAD_REQUEST."""
+    if isinstance(value, str):
+        value = [part for part in (p.strip() for p in value.split(",")) if part]
+    if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+        raise CollectorError("BAD_REQUEST", f"'{arg}' must be a list of strings or a comma-separated string")
+    return value
+
+
+def _valid_team_entry(t: Dict[str, Any]) -> bool:
+    """teams.resolve entry shape: optional str names, optional str/int leagueId."""
+    return (
+        isinstance(t.get("teamName"), (str, type(None)))
+        and isinstance(t.get("leagueName"), (str, type(None)))
+        and isinstance(t.get("leagueId"), (str, int, type(None)))
+        and not isinstance(t.get("leagueId"), bool)
+    )
+
+
+def _exact_by(candidates: List[Dict[str, Any]], key: str, value_l: str) -> List[Dict[str, Any]]:
+    """Candidates whose normalized `key` equals the already-normalized value_l."""
+    return [c for c in candidates if _lnorm(c, key) == value_l]
+
+
+def _pick_league_by_name(leagues: List[Dict[str, Any]], name_l: str) -> Dict[str, Any] | None:
+    """Single pass: first exact strLeague match wins, else the first substring match."""
+    first_contains = None
+    for L in leagues:
+        n = _lnorm(L, "strLeague")
+        if n == name_l:
+            return L
+        if first_contains is None and name_l in n:
+            first_contains = L
+    return first_contains
+
+
+# Minimum similarity (0-100) for a fuzzy league-name pick to be accepted without a substring hit.
+# Both backends score with the same normalized Indel ratio, so the cutoff means the same thing
+# with or without rapidfuzz ("premer league" ~96, "bundesliag" 90, "ligue 1" vs "ligue 2" ~86).
+_FUZZY_LEAGUE_CUTOFF = 88
+
+
+def _indel_ratio(a: str, b: str) -> float:
+    """100 * 2 * LCS(a, b) / (len(a) + len(b)); same value as rapidfuzz.fuzz.ratio.
+
+    LCS length comes from the bit-parallel algorithm (one big-int update per char of b).
+    """
+    total = len(a) + len(b)
+    if not total:
+        return 100.0
+    masks: Dict[str, int] = {}
+    for i, ch in enumerate(a):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    full = (1 << len(a)) - 1
+    v = full
+    for ch in b:
+        u = v & masks.get(ch, 0)
+        v = ((v + u) | (v - u)) & full
+    lcs = len(a) - bin(v).count("1")
+    return 200.0 * lcs / total
+
+
+def _fuzzy_pick(names: List[str], needle_l: str) -> Tuple[int, float] | None:
+    """(position, score 0-100) of the closest name to needle_l, or None below _FUZZY_LEAGUE_CUTOFF."""
+    if not needle_l or not names:
+        return None
+    if _rf_process is not None:
+        hit = _rf_process.extractOne(needle_l, names, scorer=_rf_fuzz.ratio, score_cutoff=_FUZZY_LEAGUE_CUTOFF)
+        return (hit[2], hit[1]) if hit else None
+    best: Tuple[int, float] | None = None
+    for i, n in enumerate(names):
+        score = _indel_ratio(needle_l, n)
+        if score >= _FUZZY_LEAGUE_CUTOFF and (best is None or score > best[1]):
+            best = (i, score)
+    return best
+
+
+def _index_search(index: Dict[str, Any], needle_l: str, *, first_only: bool = False) -> List[Dict[str, Any]]:
+    """Leagues whose normalized name contains needle_l, in index order.
+
+    Scans the newline-joined name string with str.find and maps hits back to
+    leagues through the start offsets, instead of a Python loop per league.
+    """
+    leagues = index["leagues"]
+    if not needle_l or "\n" in needle_l:
+        return [L for L in leagues if needle_l in _lnorm(L, "strLeague")][: 1 if first_only else None]
+    joined, offsets = index["joined"], index["offsets"]
+    out: List[Dict[str, Any]] = []
+    pos = joined.find(needle_l)
+    while pos != -1:
+        i = bisect_right(offsets, pos) - 1
+        out.append(leagues[i])
+        if first_only or i + 1 >= len(offsets):
+            break
+        pos = joined.find(needle_l, offsets[i + 1])
+    return out
 
 
 # -----------------------
@@ -55,52 +376,10 @@ class CollectorAgentV2:
             if not isinstance(args, dict):
                 raise CollectorError("BAD_REQUEST", "'args' must be an object")
 
-            if intent == "leagues.list":
-                data, resolved = self._cap_leagues_list(args, trace)
-            elif intent == "countries.list":
-                data, resolved = self._cap_countries_list(args, trace)
-            elif intent == "sports.list":
-                data, resolved = self._cap_sports_list(args, trace)
-            elif intent == "league.get":
-                data, resolved = self._cap_league_get(args, trace)
-            elif intent == "league.table":
-                data, resolved = self._cap_league_table(args, trace)
-            elif intent == "teams.list":
-                data, resolved = self._cap_teams_list(args, trace)
-            elif intent == "team.get":
-                data, resolved = self._cap_team_get(args, trace)
-            elif intent == "team.equipment":
-                data, resolved = self._cap_team_equipment(args, trace)
-            elif intent == "player.honours":
-                data, resolved = self._cap_player_honours(args, trace)
-            elif intent == "player.former_teams":
-                data, resolved = self._cap_player_former_teams(args, trace)
-            elif intent == "player.milestones":
-                data, resolved = self._cap_player_milestones(args, trace)
-            elif intent == "player.contracts":
-                data, resolved = self._cap_player_contracts(args, trace)
-            elif intent == "player.results":
-                data, resolved = self._cap_player_results(args, trace)
-            elif intent == "players.list":
-                data, resolved = self._cap_players_list(args, trace)
-            elif intent == "player.get":
-                data, resolved = self._cap_player_get(args, trace)
-            elif intent == "events.list":
-                data, resolved = self._cap_events_list(args, trace)
-            elif intent == "event.get":
-                data, resolved = self._cap_event_get(args, trace)
-            elif intent == "event.results":
-                data, resolved = self._cap_event_results(args, trace)
-            elif intent == "event.tv":
-                data, resolved = self._cap_event_tv(args, trace)
-            elif intent == "video.highlights":
-                data, resolved = self._cap_video_highlights(args, trace)
-            elif intent == "venue.get":
-                data, resolved = self._cap_venue_get(args, trace)
-            elif intent == "seasons.list":
-                data, resolved = self._cap_seasons_list(args, trace)
-            else:
+            handler = self._INTENT_DISPATCH.get(intent)
+            if handler is None:
                 raise CollectorError("UNKNOWN_INTENT", f"Unsupported intent '{intent}'")
+            data, resolved = handler(self, args, trace)
 
             return {
                 "ok": True,
@@ -122,28 +401,187 @@ class CollectorAgentV2:
                 "meta": {"trace": trace},
             }
 
+    async def handle_async(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """handle() for async callers: runs on a worker thread so the event loop keeps serving.
+
+        Independent requests can be overlapped with asyncio.gather(...).
+        """
+        return await asyncio.to_thread(self.handle, request)
+
+    def handle_batch(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run several handle() requests concurrently; responses come back in request order.
+
+        Identical upstream GETs across the batch are fetched once (see _single_flight).
+        """
+        if not isinstance(batch, list):
+            return [self.handle(batch)]
+        if len(batch) <= 1:
+            return [self.handle(r) for r in batch]
+        return list(_BATCH_POOL.map(self.handle, batch))
+
     # -----------------------
     # Helpers
     # -----------------------
     def _http(self, path: str, params: dict | None, trace: list[Dict[str, Any]]) -> dict:
-        import time
-        p = dict(params or {})
-        p["_ts"] = str(time.time())  # cache-buster
-        data = get_json(path, p)
-        trace.append({"step": "http_get", "path": path, "params": p})
+        p = params or {}  # callers pass fresh literals and never mutate them afterwards
+        key = make_key(path, p)
+        ttl = _http_ttl(path)
+        data, cached = cached_call(
+            _HTTP_CACHE, key, ttl,
+            lambda: _fetch_json(path, p, key, ttl),
+            is_ok=lambda d: bool(d) and "error" not in d,
+        )
+        trace.append({"step": "http_get", "path": path, "params": p, "cached": cached})
         return data or {}
 
+    def _http_many(self, calls: List[Tuple[str, dict]], trace: list[Dict[str, Any]]) -> List[dict]:
+        """Run independent _http calls concurrently; results and trace entries keep call order."""
+        if len(calls) <= 1:
+            return [self._http(path, params, trace) for path, params in calls]
+        traces: List[list[Dict[str, Any]]] = [[] for _ in calls]
+        futures = [
+            _HTTP_POOL.submit(self._http, path, params, sub)
+            for (path, params), sub in zip(calls, traces)
+        ]
+        results = [f.result() for f in futures]
+        for sub in traces:
+            trace.extend(sub)
+        return results
+
+    def _soccer_league_index(self, trace: list[Dict[str, Any]]) -> Dict[str, Any]:
+        """Soccer leagues from /all_leagues.php plus lookup structures over their names.
+
+        Built once per /all_leagues.php TTL and shared by the resolvers and leagues.list.
+        Returns {"leagues", "by_name" (normalized name -> league), "names" (normalized names,
+        parallel to leagues), "joined" (names joined by newlines), "offsets" (start of each
+        name in "joined")}.
+        """
+        def build() -> Dict[str, Any]:
+            data = self._http("/all_leagues.php", {}, trace)
+            leagues = [L for L in (data.get("leagues") or []) if (L.get("strSport") or "").lower() == "soccer"]
+            by_name: Dict[str, Dict[str, Any]] = {}
+            offsets: List[int] = []
+            names: List[str] = []
+            start = 0
+            for L in leagues:
+                n = _lnorm(L, "strLeague")
+                by_name.setdefault(n, L)  # first wins, like a linear scan
+                offsets.append(start)
+                names.append(n)
+                start += len(n) + 1  # "\n" separator
+            return {"leagues": leagues, "by_name": by_name, "names": names, "joined": "\n".join(names), "offsets": offsets}
+
+        index, cached = cached_call(
+            _HTTP_CACHE, make_key("soccer_league_index"), _http_ttl("/all_leagues.php"),
+            build, is_ok=lambda ix: bool(ix["leagues"]),
+        )
+        if cached:
+            trace.append({"step": "league_index_cache_hit", "count": len(index["leagues"]), "cached": cached})
+        return index
+
     def _first_exact_or_single(self, candidates: list[dict], key: str, value: str) -> Tuple[dict | None, list[dict]]:
-        v = (value or "").strip().lower()
-        exact = [c for c in candidates if (c.get(key) or "").strip().lower() == v]
-        if exact:
-            return exact[0], candidates
-        return None, candidates
+        v = _norm(value)
+        # Stop at the first exact match instead of collecting all of them
+        return next((c for c in candidates if _lnorm(c, key) == v), None), candidates
 
     # -----------------------
     # Resolvers
     # -----------------------
+    def _resolve_cached(self, kind: str, key: tuple, fn, trace: list[Dict[str, Any]]) -> str:
+        """Memoize a resolver result in _RESOLVE_CACHE; hits are recorded in the trace."""
+        value, cached = cached_call(_RESOLVE_CACHE, make_key(kind, *key), TSDB_RESOLVE_TTL, fn)
+        if cached:
+            trace.append({"step": "resolve_cache_hit", "kind": kind, "key": list(key), "cached": cached})
+        return value
+
     def _resolve_league_id(self, name: str, trace: list[Dict[str, Any]]) -> str:
+        return self._resolve_cached("league_id", (_norm(name),), lambda: self._lookup_league_id(name, trace), trace)
+
+    def _resolve_league_name(self, league_id: str, trace: list[Dict[str, Any]]) -> str:
+        return self._resolve_cached("league_name", (str(league_id or ""),), lambda: self._lookup_league_name(league_id, trace), trace)
+
+    def _resolve_team_id(
+        self,
+        name: str,
+        trace: list[Dict[str, Any]],
+        *,
+        leagueName: str | None = None,
+        leagueId: str | None = None,
+    ) -> str:
+        return self._resolve_cached(
+            "team_id",
+            (_norm(name), _norm(leagueName), str(leagueId or "")),
+            lambda: self._lookup_team_id(name, trace, leagueName=leagueName, leagueId=leagueId),
+            trace,
+        )
+
+    def _resolve_player_id(self, name: str, trace: list[Dict[str, Any]]) -> str:
+        return self._resolve_cached("player_id", (_norm(name),), lambda: self._lookup_player_id(name, trace), trace)
+
+    def resolve_team_ids(self, teams: List[Dict[str, Any]], trace: list[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Resolve many {teamName, leagueName?, leagueId?} entries in one go.
+
+        Names that share a league are matched against a single /search_all_teams.php
+        roster (one GET per league, fetched concurrently); anything left over goes
+        through _resolve_team_id in parallel. Returns one
+        {"teamName", "leagueName", "teamId" | "error"} dict per input, in order.
+        """
+        out: List[Dict[str, Any]] = [{"teamName": t.get("teamName"), "leagueName": t.get("leagueName")} for t in teams]
+        bad = {i for i, t in enumerate(teams) if not _valid_team_entry(t)}
+        for i in bad:
+            out[i]["error"] = {"code": "BAD_REQUEST", "message": "teamName/leagueName must be strings, leagueId a string or int"}
+
+        league_args: Dict[str, str] = {}  # normalized -> name as given
+        for i, t in enumerate(teams):
+            if i not in bad and t.get("teamName") and t.get("leagueName"):
+                league_args.setdefault(_norm(t["leagueName"]), t["leagueName"].strip())
+        rosters = self._http_many(
+            [("/search_all_teams.php", {"l": name, "s": "Soccer"}) for name in league_args.values()], trace
+        )
+        by_league_name: Dict[Tuple[str, str], List[str]] = {}
+        for league_l, data in zip(league_args, rosters):
+            for team in data.get("teams") or []:
+                by_league_name.setdefault((league_l, _lnorm(team, "strTeam")), []).append(str(team.get("idTeam")))
+
+        pending: List[int] = []
+        for i, t in enumerate(teams):
+            if i in bad:
+                continue
+            name = t.get("teamName")
+            if not name:
+                out[i]["error"] = {"code": "MISSING_ARG", "message": "Provide teamName"}
+                continue
+            ids = by_league_name.get((_norm(t.get("leagueName")), _norm(name))) or []
+            if len(ids) != 1:
+                pending.append(i)
+                continue
+            out[i]["teamId"] = ids[0]
+            if TSDB_RESOLVE_TTL > 0:  # later single lookups of the same name are free
+                key = make_key("team_id", _norm(name), _norm(t.get("leagueName")), str(t.get("leagueId") or ""))
+                _RESOLVE_CACHE.set(key, ids[0], TSDB_RESOLVE_TTL)
+
+        def resolve_one(i: int):
+            t, sub = teams[i], []
+            league_id = t.get("leagueId")
+            try:
+                tid = self._resolve_team_id(
+                    t["teamName"], sub, leagueName=t.get("leagueName"),
+                    leagueId=(str(league_id) if league_id else None),
+                )
+                return tid, None, sub
+            except CollectorError as e:
+                return None, {"code": e.code, "message": e.message}, sub
+
+        for i, (tid, err, sub) in zip(pending, _HTTP_POOL.map(resolve_one, pending)):
+            trace.extend(sub)
+            if err:
+                out[i]["error"] = err
+            else:
+                out[i]["teamId"] = tid
+        trace.append({"step": "teams_resolve_batch", "count": len(teams), "leagues": len(league_args), "individual": len(pending)})
+        return out
+
+    def _lookup_league_id(self, name: str, trace: list[Dict[str, Any]]) -> str:
         # TheSportsDB free tier does not expose /search_leagues.php.
         # Resolve league names by listing soccer leagues and matching locally.
         if not name:
@@ -153,37 +591,37 @@ class CollectorAgentV2:
         data = self._http("/search_all_leagues.php", {"s": "Soccer"}, trace)
         leagues = data.get("countries") or data.get("leagues") or []
 
-        name_l = name.strip().lower()
-        candidates = [L for L in leagues if name_l in ((L.get("strLeague") or "").strip().lower())]
+        # Prefer an exact name match, else the first league containing the name.
+        name_l = _norm(name)
+        pick = _pick_league_by_name(leagues, name_l)
 
-        # 2) Fallback to all_leagues then filter soccer + match by name.
-        if not candidates:
-            data_all = self._http("/all_leagues.php", {}, trace)
-            all_leagues = [L for L in (data_all.get("leagues") or []) if (L.get("strSport") or "").lower() == "soccer"]
-            candidates = [L for L in all_leagues if name_l in ((L.get("strLeague") or "").strip().lower())]
+        # 2) Fallback to the soccer league index: exact name in O(1), then substring scan.
+        if pick is None:
+            index = self._soccer_league_index(trace)
+            pick = index["by_name"].get(name_l) or next(iter(_index_search(index, name_l, first_only=True)), None)
+            # 3) Spelling variants ("Premier Leauge", "Seria A"): closest name above the cutoff.
+            if pick is None and (hit := _fuzzy_pick(index["names"], name_l)):
+                pick = index["leagues"][hit[0]]
+                trace.append({"step": "league_fuzzy_match", "league": pick.get("strLeague"), "score": round(hit[1], 1)})
 
-        if not candidates:
+        if pick is None:
             raise NotFoundError("NOT_FOUND", f"No league found for '{name}'")
-
-        # Prefer exact match if available.
-        exact = [L for L in candidates if (L.get("strLeague") or "").strip().lower() == name_l]
-        pick = exact[0] if exact else candidates[0]
         if not pick.get("idLeague"):
             raise NotFoundError("NOT_FOUND", f"Found league '{pick.get('strLeague')}' but missing idLeague")
         return str(pick.get("idLeague"))
 
-    def _resolve_league_name(self, league_id: str, trace: list[Dict[str, Any]]) -> str:
+    def _lookup_league_name(self, league_id: str, trace: list[Dict[str, Any]]) -> str:
         """Resolve leagueId -> canonical strLeague using lookupleague.php."""
         if not league_id:
             raise CollectorError("MISSING_ARG", "Provide leagueId")
         data = self._http("/lookupleague.php", {"id": league_id}, trace)
-        league = (data.get("leagues") or [None])[0] or {}
+        league = _first_row(data, "leagues") or {}
         name = (league.get("strLeague") or "").strip()
         if not name:
             raise NotFoundError("NOT_FOUND", f"No league name found for id '{league_id}'")
         return name
 
-    def _resolve_team_id(
+    def _lookup_team_id(
         self,
         name: str,
         trace: list[Dict[str, Any]],
@@ -208,18 +646,31 @@ class CollectorAgentV2:
         if not candidates:
             raise NotFoundError("NOT_FOUND", f"No team found for '{name}'")
 
-        name_l = (name or "").strip().lower()
-        exact_name = [t for t in candidates if (t.get("strTeam") or "").strip().lower() == name_l]
-
-        # Apply league filter if available
-        def match_league(t: dict) -> bool:
-            if leagueName and (t.get("strLeague") or "").strip().lower() == leagueName.strip().lower():
-                return True
-            if leagueId and str(t.get("idLeague") or "").strip() == str(leagueId):
-                return True
-            return False
-
-        filtered = [t for t in (exact_name or candidates) if (match_league(t) if (leagueName or leagueId) else True)]
+        name_l = _norm(name)
+
+        # Apply league filter if available (both sides normalized once, outside the loop)
+        league_name_l = _norm(leagueName)
+        league_id_s = str(leagueId) if leagueId else ""
+        has_league = bool(leagueName or leagueId)
+
+        # One pass: exact-name matches plus league-filtered subsets of both the exact
+        # and the full candidate lists; the exact subset wins when any exact name exists.
+        exact_name: list[dict] = []
+        exact_filtered: list[dict] = []
+        any_filtered: list[dict] = []
+        for t in candidates:
+            ok = (
+                not has_league
+                or (bool(league_name_l) and _lnorm(t, "strLeague") == league_name_l)
+                or (bool(league_id_s) and str(t.get("idLeague") or "").strip() == league_id_s)
+            )
+            if _lnorm(t, "strTeam") == name_l:
+                exact_name.append(t)
+                if ok:
+                    exact_filtered.append(t)
+            if ok:
+                any_filtered.append(t)
+        filtered = exact_filtered if exact_name else any_filtered
 
         if len(filtered) == 1:
             return str(filtered[0].get("idTeam"))
@@ -231,7 +682,7 @@ class CollectorAgentV2:
             except Exception:
                 data2 = self._http("/search_all_teams.php", {"l": leagueName}, trace)
             teams_in_league = data2.get("teams") or []
-            league_exact = [t for t in teams_in_league if (t.get("strTeam") or "").strip().lower() == name_l]
+            league_exact = _exact_by(teams_in_league, "strTeam", name_l)
             if len(league_exact) == 1:
                 return str(league_exact[0].get("idTeam"))
 
@@ -243,7 +694,7 @@ class CollectorAgentV2:
         pick = (exact_name[0] if exact_name else candidates[0])
         return str(pick.get("idTeam"))
 
-    def _resolve_player_id(self, name: str, trace: list[Dict[str, Any]]) -> str:
+    def _lookup_player_id(self, name: str, trace: list[Dict[str, Any]]) -> str:
         data = self._http("/searchplayers.php", {"p": name}, trace)
         players = data.get("player") or []
         if not players:
@@ -254,6 +705,24 @@ class CollectorAgentV2:
             raise AmbiguousError("AMBIGUOUS", f"Multiple players match '{name}'", {"choices": allc})
         return str(pick.get("idPlayer"))
 
+    def _pick_named_event(self, candidates: list[dict], event_id: str | None) -> tuple[dict | None, dict]:
+        """Pick rule shared by event.get / event.tv after a /searchevents.php name search.
+
+        With an eventId the pick must be the unique candidate carrying that id; without
+        one, only a lone candidate is picked. Returns (picked_or_none, resolution).
+        """
+        if event_id:
+            target = str(event_id).strip()
+            hits = [ev for ev in candidates if str(ev.get("idEvent") or "").strip() == target]
+            if len(hits) == 1:
+                return hits[0], {"by": "name_id_filter", "candidates": len(candidates), "matched_id": target}
+            # keep candidates; no unique pick
+            return None, {"by": "name_id_filter_ambiguous", "candidates": len(candidates), "matched_id": target}
+        # No ID filter: if there is exactly one candidate, pick it
+        if len(candidates) == 1:
+            return candidates[0], {"by": "name_unique", "candidates": 1}
+        return None, {"by": "name", "candidates": len(candidates)}
+
     def _select_event_candidate(
         self,
         candidates: list[dict],
@@ -270,34 +739,39 @@ class CollectorAgentV2:
         if not candidates:
             return None, res
 
-        # 1) If an exact id is provided, prefer it
-        if eventId:
-            for ev in candidates:
-                if str(ev.get("idEvent") or "").strip() == str(eventId):
-                    res["reason"] = "id_match"
-                    res["matched"] = {"idEvent": eventId}
-                    return ev, res
-
-        # 2) If date and/or season are provided, try to match both
-        def fits(ev: dict) -> int:
-            score = 0
-            if dateEvent and (ev.get("dateEvent") == dateEvent or ev.get("dateEventLocal") == dateEvent):
-                score += 1
-            if season and (ev.get("strSeason") == season):
-                score += 1
-            return score
-
-        if dateEvent or season:
-            best = None
-            best_score = -1
-            for ev in candidates:
-                sc = fits(ev)
+        # One pass: first exact id match, and the first candidate with the best date/season score.
+        event_id_s = str(eventId).strip() if eventId else None
+        max_score = (1 if dateEvent else 0) + (1 if season else 0)
+        id_pick = None
+        best = None
+        best_score = 0
+        for ev in candidates:
+            if event_id_s and str(ev.get("idEvent") or "").strip() == event_id_s:
+                id_pick = ev
+                break
+            if max_score and best_score < max_score:
+                sc = 0
+                if dateEvent and dateEvent in (ev.get("dateEvent"), ev.get("dateEventLocal")):
+                    sc += 1
+                if season and ev.get("strSeason") == season:
+                    sc += 1
                 if sc > best_score:
                     best, best_score = ev, sc
-            if best is not None and best_score > 0:
-                res["reason"] = "date_season_match"
-                res["matched"] = {k: v for k, v in {"dateEvent": dateEvent, "strSeason": season}.items() if v}
-                return best, res
+                    # A perfect score cannot be beaten; only an id match could still change the pick.
+                    if sc == max_score and not event_id_s:
+                        break
+
+        # 1) If an exact id is provided, prefer it
+        if id_pick is not None:
+            res["reason"] = "id_match"
+            res["matched"] = {"idEvent": eventId}
+            return id_pick, res
+
+        # 2) If date and/or season are provided, take the best-scoring candidate
+        if best is not None:
+            res["reason"] = "date_season_match"
+            res["matched"] = {k: v for k, v in {"dateEvent": dateEvent, "strSeason": season}.items() if v}
+            return best, res
 
         # 3) Fallback: if only one candidate, take it
         if len(candidates) == 1:
@@ -314,21 +788,28 @@ class CollectorAgentV2:
     def _cap_leagues_list(self, args, trace):
         # Use /all_leagues.php then filter to Soccer; alternatively /search_all_leagues.php?s=Soccer
         leagues: List[Dict[str, Any]] = []
+        index: Dict[str, Any] = {}
         try:
-            data = self._http("/all_leagues.php", {}, trace)
-            leagues = [L for L in (data.get("leagues") or []) if (L.get("strSport") or "").lower() == "soccer"]
+            index = self._soccer_league_index(trace)
+            leagues = list(index["leagues"])
         except Exception as e:
             trace.append({"step": "tsdb_leagues_error", "error": str(e)})
         name = args.get("name")
+        name_l = _norm(name)  # hoisted: reused by the exact, index and AllSports name filters below
         if "country" in args:
             trace.append({"step": "leagues_country_filter_ignored", "reason": "TSDB all_leagues lacks reliable per-league country"})
         if leagues:
             if name:
-                leagues = [L for L in leagues if name.lower() in (L.get("strLeague") or "").lower()]
+                # Every substring hit, with exact-name matches (there can be several) ranked first
+                leagues = _index_search(index, name_l)
+                exact = [L for L in leagues if _lnorm(L, "strLeague") == name_l]
+                if exact:
+                    leagues = exact + [L for L in leagues if _lnorm(L, "strLeague") != name_l]
+                    trace.append({"step": "leagues_name_exact", "count": len(exact)})
         # Fallback to AllSports API if TheSportsDB provided no leagues
-        if not leagues and allsports_client:
+        if not leagues and (allsports := _get_allsports()):
             try:
-                resp = allsports_client.leagues()
+                resp = allsports.leagues()
                 if isinstance(resp, dict) and resp.get("success") == 1:
                     leagues = [
                         {
@@ -339,7 +820,7 @@ class CollectorAgentV2:
                         for L in (resp.get("result") or [])
                     ]
                     if name:
-                        leagues = [L for L in leagues if name.lower() in (L.get("strLeague") or "").lower()]
+                        leagues = [L for L in leagues if name_l in _lnorm(L, "strLeague")]
                     if "country" in args:
                         trace.append({"step": "leagues_country_filter_ignored", "reason": "TSDB all_leagues lacks reliable per-league country"})
                     trace.append({"step": "allsports_leagues", "count": len(leagues)})
@@ -363,7 +844,7 @@ class CollectorAgentV2:
     def _cap_league_get(self, args, trace):
         league_id = args.get("leagueId") or self._resolve_league_id(args.get("leagueName"), trace)
         data = self._http("/lookupleague.php", {"id": league_id}, trace)
-        return {"league": (data.get("leagues") or [None])[0]}, {"leagueId": league_id}
+        return {"league": _first_row(data, "leagues")}, {"leagueId": league_id}
 
     def _cap_league_table(self, args, trace):
         """Return raw league standings for a given league + season.
@@ -389,38 +870,36 @@ class CollectorAgentV2:
                 if not isinstance(t, dict):
                     out.append(t)
                     continue
+                g = t.get  # bound once: roster lists run this for every team
                 # prefer existing canonical keys, then try common upstream names
-                name = (
-                    t.get("team_name")
-                    or t.get("strTeam")
-                    or t.get("name")
-                    or t.get("team")
-                    or t.get("strTeamShort")
-                    or ""
-                )
-                logo = (
-                    t.get("team_logo")
-                    or t.get("strTeamBadge")
-                    or t.get("strBadge")
-                    or t.get("logo")
-                    or t.get("team_logo")
-                    or ""
-                )
+                name = g("team_name") or g("strTeam") or g("name") or g("team") or g("strTeamShort") or ""
+                logo = g("team_logo") or g("strTeamBadge") or g("strBadge") or g("logo") or ""
                 nt = dict(t)
                 # canonical fields
                 nt["team_name"] = name
                 nt["team_logo"] = logo
-                # common aliases for downstream consumers
-                if "strTeam" not in nt or not nt.get("strTeam"):
+                # common aliases for downstream consumers (t holds the same values as nt here)
+                if not g("strTeam"):
                     nt["strTeam"] = name
-                if "strTeamBadge" not in nt or not nt.get("strTeamBadge"):
+                if not g("strTeamBadge"):
                     nt["strTeamBadge"] = logo
-                if "strBadge" not in nt or not nt.get("strBadge"):
+                if not g("strBadge"):
                     nt["strBadge"] = logo
-                if "logo" not in nt or not nt.get("logo"):
+                if not g("logo"):
                     nt["logo"] = logo
                 out.append(nt)
             return out
+
+        def _traced_normalize(raw: List[Dict[str, Any]], step: str) -> List[Dict[str, Any]]:
+            # Normalize once; the trace entry (counts + small sample) reuses the same list
+            normalized = _normalize_teams(raw)
+            try:
+                logo_count = sum(1 for t in normalized if (t.get("team_logo") or "").strip())
+                trace.append({"step": step, "count": len(normalized), "with_logo": logo_count, "sample": [ {"name": t.get("team_name"), "logo": (t.get("team_logo") or "")[:80] } for t in normalized[:3] ]})
+            except Exception:
+                pass
+            return normalized
+
         # 1) Direct team search by name
         if args.get("teamName"):
             teams: List[Dict[str, Any]] = []
@@ -429,9 +908,9 @@ class CollectorAgentV2:
                 teams = data.get("teams") or []
             except Exception as e:
                 trace.append({"step": "tsdb_team_search_error", "error": str(e)})
-            if not teams and allsports_client:
+            if not teams and (allsports := _get_allsports()):
                 try:
-                    resp = allsports_client.teams(teamName=args["teamName"])
+                    resp = allsports.teams(teamName=args["teamName"])
                     if isinstance(resp, dict) and resp.get("success") == 1:
                         teams = [
                             {
@@ -445,13 +924,8 @@ class CollectorAgentV2:
                 except Exception as e:
                     trace.append({"step": "allsports_team_search_error", "error": str(e)})
             # trace normalized result for debugging (counts + small sample)
-            try:
-                normalized = _normalize_teams(teams)
-                logo_count = sum(1 for t in normalized if (t.get("team_logo") or "").strip())
-                trace.append({"step": "teams_search_result_normalized", "count": len(normalized), "with_logo": logo_count, "sample": [ {"name": t.get("team_name"), "logo": (t.get("team_logo") or "")[:80] } for t in normalized[:3] ]})
-            except Exception:
-                pass
-            return {"teams": _normalize_teams(teams), "count": len(teams)}, {"teamName": args["teamName"]}
+            normalized = _traced_normalize(teams, "teams_search_result_normalized")
+            return {"teams": normalized, "count": len(teams)}, {"teamName": args["teamName"]}
 
         # 2) Resolve a league name, then use search_all_teams.php?l={strLeague}&s=Soccer
         league_name = (args.get("leagueName") or "").strip()
@@ -465,14 +939,19 @@ class CollectorAgentV2:
             params_primary = {"l": league_name, "s": "Soccer"}
             teams: List[Dict[str, Any]] = []
             resolved_league_id: str | None = None
+            data: Any = None
+            primary_failed = False
             try:
                 data = self._http("/search_all_teams.php", params_primary, trace)
                 teams = data.get("teams") or []
                 trace.append({"step": "search_all_teams_name", "count": len(teams)})
             except Exception as e:
+                primary_failed = True
                 trace.append({"step": "tsdb_league_team_error_primary", "error": str(e)})
 
-            if not teams:
+            # A well-formed reply ({"teams": [...] | null}) is authoritative; only retry without
+            # the sport filter when the primary call failed or came back as an error/non-JSON body.
+            if not teams and (primary_failed or not isinstance(data, dict) or "teams" not in data):
                 try:
                     data = self._http("/search_all_teams.php", {"l": league_name}, trace)
                     teams = data.get("teams") or []
@@ -501,9 +980,9 @@ class CollectorAgentV2:
                     trace.append({"step": "league_id_fallback_failed", "error": str(e)})
 
             # Fallback to AllSports if still empty
-            if not teams and allsports_client:
+            if not teams and (allsports := _get_allsports()):
                 try:
-                    resp = allsports_client.teams(leagueId=str(resolved_league_id) if resolved_league_id else None)
+                    resp = allsports.teams(leagueId=str(resolved_league_id) if resolved_league_id else None)
                     if isinstance(resp, dict) and resp.get("success") == 1:
                         teams = [
                             {
@@ -518,18 +997,9 @@ class CollectorAgentV2:
                 except Exception as e:
                     trace.append({"step": "allsports_league_teams_error", "error": str(e)})
 
-            resolved = {"leagueName": league_name}
-            if league_id:
-                resolved["leagueId"] = str(league_id)
-            if resolved_league_id and not league_id:
-                resolved["leagueId"] = str(resolved_league_id)
-            try:
-                normalized = _normalize_teams(teams)
-                logo_count = sum(1 for t in normalized if (t.get("team_logo") or "").strip())
-                trace.append({"step": "teams_league_result_normalized", "count": len(normalized), "with_logo": logo_count, "sample": [ {"name": t.get("team_name"), "logo": (t.get("team_logo") or "")[:80] } for t in normalized[:3] ]})
-            except Exception:
-                pass
-            return {"teams": _normalize_teams(teams), "count": len(teams)}, resolved
+            resolved = {"leagueName": league_name, **_pick_resolved({"leagueId": league_id or resolved_league_id}, "leagueId")}
+            normalized = _traced_normalize(teams, "teams_league_result_normalized")
+            return {"teams": normalized, "count": len(teams)}, resolved
 
         # 3) Country search (still via search_all_teams)
         if args.get("country"):
@@ -539,11 +1009,12 @@ class CollectorAgentV2:
                 teams = data.get("teams") or []
             except Exception as e:
                 trace.append({"step": "tsdb_country_team_error", "error": str(e)})
-            if not teams and allsports_client:
+            if not teams and (allsports := _get_allsports()):
                 try:
-                    resp = allsports_client.teams()
+                    resp = allsports.teams()
                     if isinstance(resp, dict) and resp.get("success") == 1:
-                        raw = [t for t in (resp.get("result") or []) if (t.get("team_country") or "").lower() == str(args["country"]).lower()]
+                        country_l = str(args["country"]).lower()
+                        raw = [t for t in (resp.get("result") or []) if (t.get("team_country") or "").lower() == country_l]
                         teams = [
                             {
                                 "idTeam": str(t.get("team_key")),
@@ -555,16 +1026,21 @@ class CollectorAgentV2:
                         trace.append({"step": "allsports_country_teams", "count": len(teams)})
                 except Exception as e:
                     trace.append({"step": "allsports_country_teams_error", "error": str(e)})
-            try:
-                normalized = _normalize_teams(teams)
-                logo_count = sum(1 for t in normalized if (t.get("team_logo") or "").strip())
-                trace.append({"step": "teams_country_result_normalized", "count": len(normalized), "with_logo": logo_count, "sample": [ {"name": t.get("team_name"), "logo": (t.get("team_logo") or "")[:80] } for t in normalized[:3] ]})
-            except Exception:
-                pass
-            return {"teams": _normalize_teams(teams), "count": len(teams)}, {"country": args["country"]}
+            normalized = _traced_normalize(teams, "teams_country_result_normalized")
+            return {"teams": normalized, "count": len(teams)}, {"country": args["country"]}
 
         raise CollectorError("MISSING_ARG", "Need teamName | leagueId/leagueName | country")
 
+    def _cap_teams_resolve(self, args, trace):
+        """Resolve several team names to ids at once: args {"teams": [{teamName, leagueName?, leagueId?}, ...]}."""
+        teams = args.get("teams")
+        if teams is None:
+            raise CollectorError("MISSING_ARG", "Provide teams: [{teamName, leagueName?}, ...]")
+        if not isinstance(teams, list) or not all(isinstance(t, dict) for t in teams):
+            raise CollectorError("BAD_REQUEST", "teams must be a list of {teamName, leagueName?, leagueId?} objects")
+        resolved = self.resolve_team_ids(teams, trace)
+        return {"teams": resolved, "count": len(resolved)}, {"teams": teams}
+
     def _cap_team_get(self, args, trace):
         """
         Team detail (RAW). Prefer lookup by id, but guard against upstream cache issues
@@ -595,7 +1071,7 @@ class CollectorAgentV2:
         lookup_ok = False
         if requested_team_id:
             data = self._http("/lookupteam.php", {"id": requested_team_id}, trace)
-            team_payload = (data.get("teams") or [None])[0]
+            team_payload = _first_row(data, "teams")
             returned_id = str(team_payload.get("idTeam")) if team_payload else None
             if team_payload and requested_team_id and returned_id == requested_team_id:
                 lookup_ok = True
@@ -620,8 +1096,7 @@ class CollectorAgentV2:
                         lookup_ok = True
                 # 2) else prefer exact name match
                 if not lookup_ok:
-                    name_l = team_name.lower()
-                    exact = [t for t in cand if (t.get("strTeam") or "").strip().lower() == name_l]
+                    exact = _exact_by(cand, "strTeam", _norm(team_name))
                     if len(exact) == 1:
                         team_payload = exact[0]
                         lookup_ok = True
@@ -660,17 +1135,26 @@ class CollectorAgentV2:
                 trace.append({"step": "league_roster_error", "error": str(e)})
 
             if roster:
-                # Match by id first, then by exact name
+                # Index the roster once by id and normalized name, then match by id first,
+                # then by exact name; either match must be unique.
+                by_id: Dict[str, List[Dict[str, Any]]] = {}
+                by_name: Dict[str, List[Dict[str, Any]]] = {}
+                for t in roster:
+                    tid = str(t.get("idTeam") or "").strip()
+                    if tid:
+                        by_id.setdefault(tid, []).append(t)
+                    nm = _lnorm(t, "strTeam")
+                    if nm:
+                        by_name.setdefault(nm, []).append(t)
                 if requested_team_id:
-                    by_id = [t for t in roster if str(t.get("idTeam") or "").strip() == requested_team_id]
-                    if len(by_id) == 1:
-                        team_payload = by_id[0]
+                    hits = by_id.get(requested_team_id) or []
+                    if len(hits) == 1:
+                        team_payload = hits[0]
                         lookup_ok = True
                 if not lookup_ok and team_name:
-                    name_l = team_name.lower()
-                    by_name = [t for t in roster if (t.get("strTeam") or "").strip().lower() == name_l]
-                    if len(by_name) == 1:
-                        team_payload = by_name[0]
+                    hits = by_name.get(_norm(team_name)) or []
+                    if len(hits) == 1:
+                        team_payload = hits[0]
                         lookup_ok = True
                 if not lookup_ok:
                     # take first as last resort
@@ -680,17 +1164,10 @@ class CollectorAgentV2:
         # As a final guard, if nothing worked but we at least have something from the primary call, return it.
         if not lookup_ok and team_payload is None and requested_team_id:
             data = self._http("/lookupteam.php", {"id": requested_team_id}, trace)
-            team_payload = (data.get("teams") or [None])[0]
+            team_payload = _first_row(data, "teams")
 
-        resolved = {}
-        if requested_team_id:
-            resolved["teamId"] = str(requested_team_id)
-        if team_name:
-            resolved["teamName"] = team_name
-        if args.get("leagueName"):
-            resolved["leagueName"] = args["leagueName"]
-        if args.get("leagueId"):
-            resolved["leagueId"] = str(args["leagueId"])
+        resolved = _pick_resolved({"teamId": requested_team_id, "teamName": team_name}, "teamId", "teamName")
+        resolved.update(_pick_resolved(args, "leagueName", "leagueId"))
 
         return {"team": team_payload}, resolved
 
@@ -710,13 +1187,7 @@ class CollectorAgentV2:
         data = self._http("/lookupequipment.php", {"id": team_id}, trace)
         equipment = data.get("equipment") or []
 
-        resolved = {"teamId": str(team_id)}
-        if args.get("teamName"):
-            resolved["teamName"] = args["teamName"]
-        if args.get("leagueName"):
-            resolved["leagueName"] = args["leagueName"]
-        if args.get("leagueId"):
-            resolved["leagueId"] = str(args["leagueId"])
+        resolved = {"teamId": str(team_id), **_pick_resolved(args, "teamName", "leagueName", "leagueId")}
 
         return {"equipment": equipment, "count": len(equipment)}, resolved
 
@@ -728,9 +1199,9 @@ class CollectorAgentV2:
                 players = data.get("player") or []
             except Exception as e:
                 trace.append({"step": "tsdb_player_search_error", "error": str(e)})
-            if not players and allsports_client:
+            if not players and (allsports := _get_allsports()):
                 try:
-                    resp = allsports_client.players(playerName=args["playerName"])
+                    resp = allsports.players(playerName=args["playerName"])
                     if isinstance(resp, dict) and resp.get("success") == 1:
                         players = [
                             {
@@ -759,9 +1230,9 @@ class CollectorAgentV2:
                 players = data.get("player") or []
             except Exception as e:
                 trace.append({"step": "tsdb_team_players_error", "error": str(e)})
-            if not players and allsports_client:
+            if not players and (allsports := _get_allsports()):
                 try:
-                    resp = allsports_client.players(teamId=str(team_id))
+                    resp = allsports.players(teamId=str(team_id))
                     if isinstance(resp, dict) and resp.get("success") == 1:
                         players = [
                             {
@@ -776,59 +1247,110 @@ class CollectorAgentV2:
             return {"players": players, "count": len(players)}, {"teamId": team_id}
         raise CollectorError("MISSING_ARG", "Need teamId/teamName or playerName")
 
+    def _cap_players_multiget(self, args, trace):
+        """players.list for several teams at once: args {"teamIds": [...]} or a whole
+        league via leagueId/leagueName (teams picked exactly like teams.list).
+
+        The /lookup_all_players.php calls run together on the shared pool (still paced
+        and cached per team), so a league roster costs about one round trip instead of
+        one per team. Returns {"teams": {teamId: [players]}}.
+        """
+        team_ids = args.get("teamIds")
+        if team_ids is not None:
+            if not isinstance(team_ids, list) or not team_ids:
+                raise CollectorError("BAD_REQUEST", "teamIds must be a non-empty list")
+            resolved: Dict[str, Any] = {}
+        elif args.get("leagueId") or args.get("leagueName"):
+            # Same roster as teams.list: /search_all_teams.php by league name, since
+            # /lookup_all_teams.php can return the wrong clubs for many ids
+            league, resolved = self._cap_teams_list(_pick_resolved(args, "leagueName", "leagueId"), trace)
+            team_ids = [t.get("idTeam") for t in league["teams"] if isinstance(t, dict)]
+        else:
+            raise CollectorError("MISSING_ARG", "Provide teamIds: [teamId, ...] or leagueId/leagueName")
+        team_ids = list(dict.fromkeys(str(t).strip() for t in team_ids if t is not None and str(t).strip()))
+
+        results = self._http_many([("/lookup_all_players.php", {"id": tid}) for tid in team_ids], trace)
+        teams = {tid: (data.get("player") or []) for tid, data in zip(team_ids, results)}
+        count = sum(len(players) for players in teams.values())
+        return {"teams": teams, "count": count}, {**resolved, "teamIds": team_ids}
+
     def _cap_player_get(self, args, trace):
         player_id = args.get("playerId") or self._resolve_player_id(args.get("playerName"), trace)
         data = self._http("/lookupplayer.php", {"id": player_id}, trace)
-        return {"player": (data.get("players") or [None])[0]}, {"playerId": player_id}
+        return {"player": _first_row(data, "players")}, {"playerId": player_id}
 
     def _cap_events_list(self, args, trace):
-        if args.get("date"):
-            data = self._http("/eventsday.php", {"d": args["date"], "s": "Soccer"}, trace)
-            return {"events": data.get("events") or []}, {"date": args["date"]}
-        if args.get("eventName"):
-            data = self._http("/searchevents.php", {"e": args["eventName"]}, trace)
-            return {"events": data.get("event") or []}, {"eventName": args["eventName"]}
+        """events.list; optional `fields` (list of TSDB keys, e.g. ["idEvent", "strEvent"], or
+        "idEvent,strEvent")
+        trims each event to those keys and optional `limit` keeps only the first N events,
+        so season-sized lists stay small downstream."""
+        events, resolved = self._events_for(args, trace)
+        limit = args.get("limit")
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except (TypeError, ValueError):
+                raise CollectorError("BAD_REQUEST", "'limit' must be an integer")
+            if limit > 0:
+                events = events[:limit]  # slice before projecting so dropped rows are never copied
+        fields = args.get("fields")
+        if fields:
+            keep = tuple(_str_list(fields, "fields"))
+            events = [{k: ev[k] for k in keep if k in ev} for ev in events]
+        return {"events": events}, resolved
+
+    def _events_for(self, args, trace):
+        for arg, path, param, extra, key in _EVENTS_BY_ARG:
+            value = args.get(arg)
+            if value:
+                data = self._http(path, {param: value, **extra}, trace)
+                return data.get(key) or [], {arg: value}
+        kind = args.get("kind")
         league_id = args.get("leagueId")
         if args.get("leagueName") and not league_id:
             league_id = self._resolve_league_id(args["leagueName"], trace)
         if league_id:
             if args.get("season"):
                 data = self._http("/eventsseason.php", {"id": league_id, "s": args["season"]}, trace)
-                return {"events": data.get("events") or []}, {"leagueId": league_id, "season": args["season"]}
-            if args.get("kind") == "next":
-                data = self._http("/eventsnextleague.php", {"id": league_id}, trace)
-                return {"events": data.get("events") or []}, {"leagueId": league_id, "kind": "next"}
-            data = self._http("/eventspastleague.php", {"id": league_id}, trace)
-            return {"events": data.get("events") or []}, {"leagueId": league_id, "kind": "past"}
-        team_id = args.get("teamId")
-        if args.get("teamName") and not team_id:
-            team_id = self._resolve_team_id(args["teamName"], trace)
-        if team_id:
-            if args.get("kind") == "next":
-                data = self._http("/eventsnext.php", {"id": team_id}, trace)
-                return {"events": data.get("events") or []}, {"teamId": team_id, "kind": "next"}
-            data = self._http("/eventslast.php", {"id": team_id}, trace)
-            return {"events": data.get("results") or []}, {"teamId": team_id, "kind": "last"}
-        raise CollectorError("MISSING_ARG", "Need date | leagueId/leagueName | teamId/teamName")
+                return data.get("events") or [], {"leagueId": league_id, "season": args["season"]}
+            scope, id_key = _EVENTS_BY_KIND["league"], "leagueId"
+            scoped_id = league_id
+        else:
+            team_id = args.get("teamId")
+            if args.get("teamName") and not team_id:
+                team_id = self._resolve_team_id(args["teamName"], trace)
+            if not team_id:
+                raise CollectorError("MISSING_ARG", "Need date | leagueId/leagueName | teamId/teamName")
+            scope, id_key = _EVENTS_BY_KIND["team"], "teamId"
+            scoped_id = team_id
+        kind, path, key = scope.get(kind if isinstance(kind, str) else None) or scope[None]
+        data = self._http(path, {"id": scoped_id}, trace)
+        return data.get(key) or [], {id_key: scoped_id, "kind": kind}
+
+    def _wanted_expansions(self, event: dict, expand_set: frozenset, out: dict, trace: list[Dict[str, Any]]):
+        """_EVENT_EXPANSIONS rows to fetch for `event`; known-empty ones are set to [] in out."""
+        skip = _expansions_without_data(event) & expand_set
+        if skip:
+            for name in skip:
+                out[name] = []
+            trace.append({"step": "expansions_skipped", "eventId": event.get("idEvent"), "expand": sorted(skip)})
+        return [row for row in _EVENT_EXPANSIONS if row[0] in expand_set and row[0] not in skip]
 
     def _cap_event_get(self, args, trace):
 
-        expand = args.get("expand") or []
+        expand = _str_list(args.get("expand") or [], "expand")
+        expand_set = frozenset(expand)
         event_name = (args.get("eventName") or "").strip()
         event_id = (args.get("eventId") or "").strip() or None
 
         def _attach_expansions(out: dict, chosen_id: str):
             if not chosen_id:
                 return out
-            if "timeline" in expand:
-                tl = self._http("/lookuptimeline.php", {"id": chosen_id}, trace)
-                out["timeline"] = tl.get("timeline") or []
-            if "stats" in expand:
-                st = self._http("/lookupeventstats.php", {"id": chosen_id}, trace)
-                out["stats"] = st.get("eventstats") or []
-            if "lineup" in expand:
-                lu = self._http("/lookuplineup.php", {"id": chosen_id}, trace)
-                out["lineup"] = lu.get("lineup") or []
+            # The lookups are independent, so fetch them together
+            wanted = self._wanted_expansions(out["event"], expand_set, out, trace)
+            results = self._http_many([(path, {"id": chosen_id}) for _, path, _ in wanted], trace)
+            for (name, _, keys), data in zip(wanted, results):
+                out[name] = next((data[k] for k in keys if data.get(k)), [])
             return out
 
         # --- NAME-FIRST PATH ---
@@ -836,24 +1358,7 @@ class CollectorAgentV2:
             data = self._http("/searchevents.php", {"e": event_name}, trace)
             candidates = data.get("event") or []
 
-            picked = None
-            resolution = {"by": "name", "candidates": len(candidates)}
-
-            # If an ID is supplied as well, filter candidates by that ID
-            if event_id:
-                filtered = [ev for ev in candidates if str(ev.get("idEvent") or "").strip() == str(event_id)]
-                if len(filtered) == 1:
-                    picked = filtered[0]
-                    resolution = {"by": "name_id_filter", "candidates": len(candidates), "matched_id": str(event_id)}
-                else:
-                    # keep candidates; no unique pick
-                    resolution = {"by": "name_id_filter_ambiguous", "candidates": len(candidates), "matched_id": str(event_id)}
-            else:
-                # No ID filter: if there is exactly one candidate, pick it
-                if len(candidates) == 1:
-                    picked = candidates[0]
-                    resolution = {"by": "name_unique", "candidates": 1}
-
+            picked, resolution = self._pick_named_event(candidates, event_id)
             out: dict = {"candidates": candidates, "resolution": resolution}
 
             # If we selected one, RETURN THE PICKED CANDIDATE (no extra lookupevent.php)
@@ -879,6 +1384,42 @@ class CollectorAgentV2:
             "ID-only event lookups are disabled. Provide eventName (optionally with eventId/date/season) so we can resolve via searchevents.php and then expand by the chosen id."
         )
 
+    def _cap_events_multiget(self, args, trace):
+        """event.get for several names at once: args {"eventNames": [...], "expand": [...]}.
+
+        All /searchevents.php calls run together, then every expansion for every picked
+        event in a second round, so N events cost about two round trips instead of N.
+        Returns {"events": {eventName: <event.get payload>}}; duplicate names are fetched once.
+        """
+        names = args.get("eventNames")
+        if not isinstance(names, list) or not names:
+            raise CollectorError("MISSING_ARG", "Provide eventNames: [eventName, ...]")
+        names = list(dict.fromkeys(n.strip() for n in names if isinstance(n, str) and n.strip()))
+        expand = _str_list(args.get("expand") or [], "expand")
+        expand_set = frozenset(expand)
+
+        searches = self._http_many([("/searchevents.php", {"e": n}) for n in names], trace)
+        events: Dict[str, dict] = {}
+        calls: List[Tuple[str, dict]] = []
+        owners: List[Tuple[dict, str, Tuple[str, ...]]] = []
+        for name, data in zip(names, searches):
+            candidates = data.get("event") or []
+            picked, resolution = self._pick_named_event(candidates, None)
+            out: dict = {"candidates": candidates, "resolution": resolution}
+            if picked:
+                out["event"] = picked
+                chosen_id = str(picked.get("idEvent"))
+                for exp_name, path, keys in self._wanted_expansions(picked, expand_set, out, trace):
+                    calls.append((path, {"id": chosen_id}))
+                    owners.append((out, exp_name, keys))
+            events[name] = out
+
+        for (out, exp_name, keys), data in zip(owners, self._http_many(calls, trace)):
+            out[exp_name] = next((data[k] for k in keys if data.get(k)), [])
+
+        resolved = {"eventNames": names, **({"expand": expand} if expand else {})}
+        return {"events": events, "count": len(events)}, resolved
+
     def _cap_seasons_list(self, args, trace):
         league_id = args.get("leagueId") or self._resolve_league_id(args.get("leagueName"), trace)
         data = self._http("/search_all_seasons.php", {"id": league_id}, trace)
@@ -891,17 +1432,11 @@ class CollectorAgentV2:
         trace: List[Dict[str, Any]] | None = None,
     ) -> List[Dict[str, Any]]:
         """Return RAW teams for a given league id via /lookup_all_teams.php (no normalization).
-        Uses _http so calls are cache-busted and traced.
+        Uses _http so calls are cached and traced.
         """
         t = trace if trace is not None else []
         data = self._http("/lookup_all_teams.php", {"id": league_id}, t) or {}
-        raw = data.get("teams") or []
-        self._sleep()
-        return raw
-
-    def _sleep(self):
-        import time
-        time.sleep(1)  # Polite pause to avoid rate limits
+        return data.get("teams") or []
 
     def _cap_sports_list(self, args, trace):
         """Proxy /all_sports.php (raw)."""
@@ -966,13 +1501,10 @@ class CollectorAgentV2:
         if event_name:
             data = self._http("/searchevents.php", {"e": event_name}, trace)
             candidates = data.get("event") or []
-            if event_id:
-                filt = [ev for ev in candidates if str(ev.get("idEvent") or "").strip() == str(event_id)]
-                if len(filt) == 1:
-                    chosen_id = str(filt[0].get("idEvent"))
-                # if ambiguous, leave chosen_id None and just return candidates
-            elif len(candidates) == 1:
-                chosen_id = str(candidates[0].get("idEvent"))
+            # if ambiguous, leave chosen_id None and just return candidates
+            picked, _resolution = self._pick_named_event(candidates, event_id)
+            if picked:
+                chosen_id = str(picked.get("idEvent"))
         else:
             chosen_id = event_id  # fallback support
 
@@ -981,26 +1513,21 @@ class CollectorAgentV2:
             tv = self._http("/lookuptv.php", {"id": chosen_id}, trace)
             out["tv"] = tv.get("tvchannels") or tv.get("tv") or []
 
-        resolved = {}
-        if event_name:
-            resolved["eventName"] = event_name
-        if event_id or chosen_id:
-            resolved["eventId"] = chosen_id or event_id
-        return out, resolved
+        return out, _pick_resolved({"eventName": event_name, "eventId": chosen_id or event_id}, "eventName", "eventId")
 
     def _cap_video_highlights(self, args, trace):
         """Search YouTube/highlights metadata for an event by name, optional eventId filter.
         Endpoint: /searcheventsvideos.php?e={name}
         """
         event_name = (args.get("eventName") or "").strip()
-        event_id = (args.get("eventId") or "").strip() or None
+        event_id = str(args.get("eventId") or "").strip() or None
         if not event_name:
             raise CollectorError("MISSING_ARG", "Provide eventName for video.highlights")
 
         data = self._http("/searcheventsvideos.php", {"e": event_name}, trace)
         videos = data.get("event") or []
         if event_id:
-            videos = [v for v in videos if str(v.get("idEvent") or "").strip() == str(event_id)]
+            videos = [v for v in videos if str(v.get("idEvent") or "").strip() == event_id]
         return {"videos": videos, "count": len(videos)}, {"eventName": event_name, **({"eventId": event_id} if event_id else {})}
 
     def _cap_venue_get(self, args, trace):
@@ -1008,7 +1535,7 @@ class CollectorAgentV2:
         venue_id = args.get("venueId")
         if venue_id:
             data = self._http("/lookupvenue.php", {"id": venue_id}, trace)
-            return {"venue": (data.get("venues") or [None])[0]}, {"venueId": str(venue_id)}
+            return {"venue": _first_row(data, "venues")}, {"venueId": str(venue_id)}
 
         event_name = (args.get("eventName") or "").strip()
         event_id = (args.get("eventId") or "").strip() or None
@@ -1024,4 +1551,33 @@ class CollectorAgentV2:
         if not v_id:
             return {"venue": None}, {"eventName": event_name, **({"eventId": event_id} if event_id else {})}
         v = self._http("/lookupvenue.php", {"id": v_id}, trace)
-        return {"venue": (v.get("venues") or [None])[0]}, {"venueId": str(v_id), "eventName": event_name}
\ No newline at end of file
+        return {"venue": _first_row(v, "venues")}, {"venueId": str(v_id), "eventName": event_name}
+
+    # Intent -> capability, built once at class creation (one dict lookup per request).
+    _INTENT_DISPATCH: Dict[str, Callable[..., Tuple[Any, Any]]] = {
+        "leagues.list": _cap_leagues_list,
+        "countries.list": _cap_countries_list,
+        "sports.list": _cap_sports_list,
+        "league.get": _cap_league_get,
+        "league.table": _cap_league_table,
+        "teams.list": _cap_teams_list,
+        "teams.resolve": _cap_teams_resolve,
+        "team.get": _cap_team_get,
+        "team.equipment": _cap_team_equipment,
+        "player.honours": _cap_player_honours,
+        "player.former_teams": _cap_player_former_teams,
+        "player.milestones": _cap_player_milestones,
+        "player.contracts": _cap_player_contracts,
+        "player.results": _cap_player_results,
+        "players.list": _cap_players_list,
+        "players.multiget": _cap_players_multiget,
+        "player.get": _cap_player_get,
+        "events.list": _cap_events_list,
+        "event.get": _cap_event_get,
+        "events.multiget": _cap_events_multiget,
+        "event.results": _cap_event_results,
+        "event.tv": _cap_event_tv,
+        "video.highlights": _cap_video_highlights,
+        "venue.get": _cap_venue_get,
+        "seasons.list": _cap_seasons_list,
+    }
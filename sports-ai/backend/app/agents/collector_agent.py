@@ -36,12 +36,14 @@ Design notes:
 
 from __future__ import annotations
 
+import codecs
 import os
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from difflib import SequenceMatcher
 
 import requests
+from requests.adapters import HTTPAdapter
 import joblib
 
 
@@ -56,10 +58,35 @@ ALLSPORTS_BASE_URL = (os.environ.get("ALLSPORTS_BASE_URL") or "https://apiv2.all
 ALLSPORTS_COUNTRIES_TTL = max(int(os.environ.get("ALLSPORTS_COUNTRIES_TTL", "3600")), 0)
 ALLSPORTS_LEAGUES_TTL = max(int(os.environ.get("ALLSPORTS_LEAGUES_TTL", "3600")), 0)
 
+# Keep-alive pool for AllSports, separate from the TheSportsDB client so a burst of
+# fallback calls never competes with TSDB for connections.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
 # Simple in-process caches keyed by request scope.
 _COUNTRIES_CACHE: Dict[str, Any] = {"data": None, "exp": 0.0}
 _LEAGUES_CACHE: Dict[str, Dict[str, Any]] = {}
 
+# Lowercased name views of cached Countries/Leagues payloads, built once per payload
+# object so resolvers don't re-lowercase every row on every lookup.
+_NAME_INDEXES: Dict[Tuple[int, str], Tuple[list, Dict[str, dict], List[Tuple[str, dict]]]] = {}
+
+
+def _name_index(rows: list, name_key: str) -> Tuple[Dict[str, dict], List[Tuple[str, dict]]]:
+    """Return ({lowered name: first row}, [(lowered name, row), ...]) for a cached payload."""
+    entry = _NAME_INDEXES.get((id(rows), name_key))
+    if entry is None or entry[0] is not rows:
+        if len(_NAME_INDEXES) >= 32:  # payloads were refreshed; drop views of old lists
+            _NAME_INDEXES.clear()
+        lowered = [((r.get(name_key) or "").strip().lower(), r) for r in rows]
+        exact: Dict[str, dict] = {}
+        for n, r in lowered:
+            exact.setdefault(n, r)
+        entry = (rows, exact, lowered)
+        _NAME_INDEXES[(id(rows), name_key)] = entry
+    return entry[1], entry[2]
+
+
 LEAGUE_ID_FALLBACK: Dict[str, str] = {
     "premier league": "152",
     "english premier league": "152",
@@ -93,16 +120,33 @@ class CollectorError(Exception):
 # Raw HTTP helper
 # -----------------------
 
+# Feeds that change during a match must never be served from an intermediate cache;
+# reference data (countries, leagues, teams, standings, ...) may be.
+_CACHE_BUST_METS = frozenset({"Livescore", "OddsLive", "Fixtures", "Comments"})
+
+
+def _text_head(r: Any, n: int = 200) -> str:
+    """First n bytes of the body as text. r.text would decode (and charset-sniff) the whole
+    body; an unknown charset label falls back to utf-8 instead of raising LookupError."""
+    encoding = r.encoding or "utf-8"
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        encoding = "utf-8"
+    return (r.content or b"")[:n].decode(encoding, errors="replace")
+
+
 def _raw_get(params: Dict[str, Any], timeout: int = 30) -> Dict[str, Any]:
-    """Perform a GET to AllSports with the given params (plus APIkey + cache-buster).
+    """Perform a GET to AllSports with the given params (plus APIkey, and a cache-buster for live feeds).
     Returns: a dict with keys {ok, status, data, text_head} where `data` is the parsed JSON or None.
     """
     q = dict(params or {})
     q["APIkey"] = ALLSPORTS_API_KEY or ""  # allow empty for clearer errors
-    q["_ts"] = str(time.time())
+    if q.get("met") in _CACHE_BUST_METS:
+        q["_ts"] = str(time.time())
     try:
-        r = requests.get(ALLSPORTS_BASE_URL, params=q, timeout=timeout)
-        head = (r.text or "")[:200]
+        r = _SESSION.get(ALLSPORTS_BASE_URL, params=q, timeout=timeout)
+        head = _text_head(r)
         try:
             data = r.json()
         except Exception:
@@ -423,21 +467,19 @@ class AllSportsRawAgent:
     def _resolve_country_id(self, country_name: str, trace: list[dict]) -> str | None:
         if not country_name:
             return None
-        countries = self._countries_cached(trace)
+        exact, lowered = _name_index(self._countries_cached(trace), "country_name")
         name_l = country_name.strip().lower()
         # prefer exact match, fallback to contains
-        exact = [c for c in countries if (c.get("country_name") or "").strip().lower() == name_l]
-        cand = exact or [c for c in countries if name_l in (c.get("country_name") or "").strip().lower()]
-        return (cand[0].get("country_key") if cand and cand[0].get("country_key") else None)
+        pick = exact.get(name_l) or next((c for n, c in lowered if name_l in n), None)
+        return (pick.get("country_key") if pick and pick.get("country_key") else None)
 
     def _resolve_league_id(self, league_name: str, trace: list[dict], *, countryId: str | None = None) -> str | None:
         if not league_name:
             return None
-        leagues = self._leagues_cached(trace, countryId=countryId)
+        exact, lowered = _name_index(self._leagues_cached(trace, countryId=countryId), "league_name")
         name_l = league_name.strip().lower()
-        exact = [l for l in leagues if (l.get("league_name") or "").strip().lower() == name_l]
-        cand = exact or [l for l in leagues if name_l in (l.get("league_name") or "").strip().lower()]
-        league_key = (cand[0].get("league_key") if cand and cand[0].get("league_key") else None)
+        pick = exact.get(name_l) or next((l for n, l in lowered if name_l in n), None)
+        league_key = (pick.get("league_key") if pick and pick.get("league_key") else None)
         if league_key:
             return str(league_key)
         fallback = LEAGUE_ID_FALLBACK.get(name_l)
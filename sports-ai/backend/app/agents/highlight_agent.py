@@ -32,7 +32,7 @@ _EVENT_ID_KEYS: Tuple[str, ...] = (
 # --- Timeline data structures ---
 
 
-@dataclass
+@dataclass(slots=True)
 class TimelineItem:
     minute: int
     team: str  # "home" | "away"
@@ -55,7 +55,7 @@ class TimelineItem:
 # --- Video highlight data structures ---
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoCandidate:
     id: str
     url: str
@@ -85,6 +85,9 @@ class VideoCandidate:
         return payload
 
 
+_RFC3339_UTC = "%Y-%m-%dT%H:%M:%SZ"  # YouTube publishedAfter/publishedBefore format
+
+
 def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -420,11 +423,11 @@ class HighlightAgent:
         }
         if window_before:
             params["publishedAfter"] = (
-                window_before.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+                window_before.astimezone(timezone.utc).strftime(_RFC3339_UTC)
             )
         if window_after:
             params["publishedBefore"] = (
-                window_after.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+                window_after.astimezone(timezone.utc).strftime(_RFC3339_UTC)
             )
 
         try:
@@ -1129,12 +1132,15 @@ def _derive_timeline_type(
     description: Optional[str],
     entry: Dict[str, Any],
 ) -> Optional[str]:
-    tag_text = " ".join(tags)
-    desc = (description or "").lower()
-    type_field = str(entry.get("type") or entry.get("event_type") or "").lower()
+    # One haystack instead of three scans per needle; "\n" keeps needles from spanning fields
+    haystack = "\n".join((
+        " ".join(tags),
+        (description or "").lower(),
+        str(entry.get("type") or entry.get("event_type") or "").lower(),
+    ))
 
     def has(needle: str) -> bool:
-        return needle in tag_text or needle in desc or needle in type_field
+        return needle in haystack
 
     if has("own goal"):
         return "own_goal"
@@ -766,7 +766,7 @@ async def call_tsdb_agent(payload: Dict[str, Any], trace: List[Dict[str, Any]])
             pass
         try:
             agent = CollectorAgentV2()
-            resp = agent.handle(payload)
+            resp = await agent.handle_async(payload)
             # If local handler signals failure, fall back to HTTP
             if isinstance(resp, dict) and resp.get("ok") is False:
                 raise RuntimeError("local-tsdb-failed")
@@ -784,8 +784,8 @@ async def call_tsdb_agent(payload: Dict[str, Any], trace: List[Dict[str, Any]])
             if (TSDB_AGENT_URL and ("127.0.0.1" in TSDB_AGENT_URL or "localhost" in TSDB_AGENT_URL) and TSDB_AGENT_URL.rstrip('/').endswith('/collect')):
                 try:
                     from backend.app.main import collect as main_collect
-                    # main.collect expects a request dict
-                    return main_collect(payload)
+                    # main.collect expects a request dict; it blocks, so keep it off the event loop
+                    return await asyncio.to_thread(main_collect, payload)
                 except Exception:
                     pass
         except Exception:
@@ -948,10 +948,17 @@ def norm_allsports_event(raw: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 def _safe_int(x: Any) -> Optional[int]:
-    try:
-        if x is None or x == "":
-            return None
-        return int(str(x).strip())
+    if x is None:
+        return None
+    if type(x) is int:
+        return x
+    s = (x if type(x) is str else str(x)).strip()
+    if s.isdecimal():  # common provider shape ("2"): no exception setup needed
+        return int(s)
+    if not s:
+        return None
+    try:  # signs, underscores and other inputs int() accepts
+        return int(s)
     except Exception:
         return None
 
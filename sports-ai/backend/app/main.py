@@ -1,5 +1,5 @@
-import os
-from fastapi import FastAPI, Body, APIRouter, HTTPException, Query
+import os, secrets
+from fastapi import FastAPI, Body, APIRouter, Header, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
@@ -10,6 +10,7 @@ from .services.highlight_search import search_event_highlights
 from .services.nl_search import parse_nl_query
 from .agents.analysis_agent import AnalysisAgent
 from .agents.collector_agent import AllSportsRawAgent
+from .agents.collector import clear_caches as clear_tsdb_caches
 
 app = FastAPI(title="Sports Collector HM (Unified)", version="0.3.0")
 
@@ -280,6 +281,18 @@ def api_h2h(
 def _debug_routes():  # pragma: no cover
     return {"count": len(app.routes), "paths": sorted({r.path for r in app.routes})}
 
+# Drop cached TheSportsDB responses/resolutions (e.g. after a league rename upstream).
+# Admin-only: disabled (404) unless ADMIN_TOKEN is set, then requires a matching X-Admin-Token.
+@app.post("/_debug/cache/clear")
+def _debug_cache_clear(x_admin_token: str | None = Header(default=None)):  # pragma: no cover
+    admin_token = os.getenv("ADMIN_TOKEN", "").strip()
+    if not admin_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not (x_admin_token and secrets.compare_digest(x_admin_token, admin_token)):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+    clear_tsdb_caches()
+    return {"ok": True}
+
 
 # --- Event highlight search (free-form, no provider key needed) ---
 @app.get('/highlight/event')
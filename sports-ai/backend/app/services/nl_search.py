@@ -25,6 +25,11 @@ try:  # optional dependency for lightweight spell correction
 except ImportError:  # pragma: no cover - fallback when library missing
     SpellChecker = None  # type: ignore[assignment]
 
+try:  # optional: one automaton pass instead of a substring test per alias
+    import ahocorasick
+except ImportError:  # pragma: no cover - fallback when library missing
+    ahocorasick = None  # type: ignore[assignment]
+
 
 # Canonical league metadata (lowercase key -> (display_name, default_country))
 LEAGUE_CANONICAL: Dict[str, tuple[str, Optional[str]]] = {
@@ -364,13 +369,6 @@ def _sanitize_alias(value: str) -> str:
     return " ".join(re.sub(r"[^a-z0-9]+", " ", value.lower()).split())
 
 
-def _contains_phrase(sanitized_text: str, phrase: str) -> bool:
-    sanitized_phrase = _sanitize_alias(phrase)
-    if not sanitized_phrase:
-        return False
-    return f" {sanitized_phrase} " in f" {sanitized_text} "
-
-
 def _is_league_or_country_phrase(phrase: str) -> bool:
     sanitized = _sanitize_alias(phrase)
     return sanitized in LEAGUE_SANITIZED_LOOKUP or sanitized in COUNTRY_SANITIZED_LOOKUP
@@ -395,6 +393,46 @@ TEAM_LOOKUP_ORDERED: List[Tuple[str, str]] = sorted(
 )
 
 
+class _PhraseTable:
+    """Ordered (phrase, value) pairs matched as whole words against sanitized text.
+
+    Phrases are sanitized and space-padded once at import; first() returns the value of
+    the earliest pair (in table order) whose phrase occurs as whole words. With
+    pyahocorasick the text is scanned once for all phrases.
+    """
+
+    def __init__(self, pairs: Iterable[Tuple[str, Any]]) -> None:
+        self.items: List[Tuple[str, Any]] = []
+        for phrase, value in pairs:
+            sanitized = _sanitize_alias(phrase)
+            if sanitized:
+                self.items.append((f" {sanitized} ", value))
+        self._automaton = None
+        if ahocorasick is not None and self.items:
+            automaton = ahocorasick.Automaton()
+            for i, (padded, _) in enumerate(self.items):
+                if padded not in automaton:  # duplicates: the earlier entry keeps priority
+                    automaton.add_word(padded, i)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def first(self, sanitized_text: str) -> Any:
+        padded = f" {sanitized_text} "
+        if self._automaton is not None:
+            best = min((i for _, i in self._automaton.iter(padded)), default=None)
+            return None if best is None else self.items[best][1]
+        for phrase, value in self.items:
+            if phrase in padded:
+                return value
+        return None
+
+
+TEAM_PHRASES = _PhraseTable(TEAM_LOOKUP_ORDERED)
+LEAGUE_ALIAS_PHRASES = _PhraseTable(LEAGUE_ALIASES.items())
+LEAGUE_CANONICAL_PHRASES = _PhraseTable(LEAGUE_CANONICAL.items())
+COUNTRY_PHRASES = _PhraseTable(COUNTRY_CANONICAL.items())
+
+
 def _build_spell_vocab() -> set[str]:
     vocab: set[str] = set()
 
@@ -663,9 +701,9 @@ def _extract_team_candidate(text: str, normalized_low: str) -> Optional[str]:
                 return _normalize_team(candidate)
 
     sanitized_low = _sanitize_alias(normalized_low)
-    for alias, canonical in TEAM_LOOKUP_ORDERED:
-        if _contains_phrase(sanitized_low, alias):
-            return canonical
+    canonical = TEAM_PHRASES.first(sanitized_low)
+    if canonical:
+        return canonical
 
     m_team = re.search(r"\b([A-Z][a-z]+(?: [A-Z][a-z]+){0,3})\b", text)
     if m_team:
@@ -880,18 +918,17 @@ def _extract_strings(s: str, normalized_low: Optional[str] = None) -> Dict[str,
 
     if "leagueName" not in ents:
         # Direct alias match
-        for alias, canonical in LEAGUE_ALIASES.items():
-            if _contains_phrase(sanitized_low, alias):
-                ents["leagueName"] = canonical
-                break
+        canonical = LEAGUE_ALIAS_PHRASES.first(sanitized_low)
+        if canonical:
+            ents["leagueName"] = canonical
 
     if "leagueName" not in ents:
-        for key, (display, country) in LEAGUE_CANONICAL.items():
-            if _contains_phrase(sanitized_low, key):
-                ents["leagueName"] = display
-                if country and "countryName" not in ents:
-                    ents["countryName"] = country
-                break
+        hit = LEAGUE_CANONICAL_PHRASES.first(sanitized_low)
+        if hit:
+            display, country = hit
+            ents["leagueName"] = display
+            if country and "countryName" not in ents:
+                ents["countryName"] = country
 
     if "leagueName" not in ents:
         fuzzy = _fuzzy_league_from_text(normalized)
@@ -902,10 +939,9 @@ def _extract_strings(s: str, normalized_low: Optional[str] = None) -> Dict[str,
                 ents["countryName"] = league_country
 
     if "countryName" not in ents:
-        for key, country in COUNTRY_CANONICAL.items():
-            if _contains_phrase(sanitized_low, key):
-                ents["countryName"] = country
-                break
+        country = COUNTRY_PHRASES.first(sanitized_low)
+        if country:
+            ents["countryName"] = country
 
     return ents
 
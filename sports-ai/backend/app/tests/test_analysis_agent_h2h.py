@@ -71,4 +71,26 @@ def test_h2h_winprob_dirichlet():
         assert 0.0 < v < 1.0
 
     # sample size is reported under inputs
-    assert res["data"]["inputs"]["sample_size"] == 3
\ No newline at end of file
+    assert res["data"]["inputs"]["sample_size"] == 3
+
+def test_conflicting_id_keys_keep_each_callers_lookup_order():
+    from backend.app.agents import analysis_agent as aa
+
+    # Normalized ids disagree with the AllSports-style ones on the same row
+    row = {
+        "home_team_id": "T100", "away_team_id": "T200",
+        "homeTeamId": "T200", "awayTeamId": "T100",
+        "home_team_goal": 2, "away_team_goal": 1,
+    }
+    agent = AnalysisAgent(all_sports_agent=FakeAllSports())
+    memo = {}
+    # analysis.h2h reads homeTeamId first -> reversed orientation
+    assert aa._match_core(row, memo, aa._H2H_ID_KEYS) == ((2, 1), "T200", "T100")
+    # win-probability orientation reads home_team_id first -> same orientation,
+    # even when sharing the request memo with the h2h consumer
+    _, rh, ra = aa._match_core(row, memo, aa._ORIENTATION_ID_KEYS)
+    assert (rh, ra) == ("T100", "T200")
+    assert agent._is_same_orientation(row, "T100", "T200", None, None) is True
+    assert agent._is_same_orientation(row, "T100", "T200", None, None, row_ids=(rh, ra)) is True
+    # default order (event extraction / H2H row filtering)
+    assert aa._team_ids(row) == ("T100", "T200")
@@ -158,4 +158,66 @@ def test_form_and_h2h():
     assert f["ok"] and f["data"]["home_metrics"]["games"] > 0 and f["data"]["away_metrics"]["games"] > 0
 
     h = agent.handle("analysis.h2h", {"eventId": "E1", "lookback": 3})
-    assert h["ok"] and h["data"]["sample_size"] >= 2
\ No newline at end of file
+    assert h["ok"] and h["data"]["sample_size"] >= 2
+
+def test_match_insights_bundles_all_sections():
+    agent = AnalysisAgent(all_sports_agent=FakeAllSports())
+    r = agent.handle("analysis.match_insights", {"eventId": "E1"})
+    assert r["ok"] is True
+    data = r["data"]
+    assert data["form"]["home_metrics"]["games"] > 0 and data["form"]["away_metrics"]["games"] > 0
+    assert data["h2h"]["sample_size"] >= 2
+    assert data["winprob"]["method"] == "odds_implied"
+    steps = [t.get("step") for t in r["meta"]["trace"]]
+    assert steps.count("sports.fixtures.list") == 2 and steps.count("sports.h2h") == 1
+    assert "h2h.prefetch" in steps
+
+
+def test_match_insights_winprob_reuses_prefetched_h2h():
+    fake = FakeAllSports()
+    fake.event_E2 = dict(fake.event_E2, home_team_key="T1", away_team_key="T2")
+    agent = AnalysisAgent(all_sports_agent=fake)
+    r = agent.handle("analysis.match_insights", {"eventId": "E2"})
+    assert r["ok"] is True
+    assert r["data"]["winprob"]["method"] == "h2h_dirichlet"
+    steps = [t.get("step") for t in r["meta"]["trace"]]
+    assert steps.count("sports.h2h") == 1
+
+
+def test_provider_responses_are_cached_between_requests():
+    fake = FakeAllSports()
+    calls = []
+    inner = fake.handle
+    fake.handle = lambda req: (calls.append(req.get("intent")), inner(req))[1]
+    agent = AnalysisAgent(all_sports_agent=fake)
+
+    first = agent.handle("analysis.form", {"eventId": "E1", "lookback": 5})
+    n_first = len(calls)
+    second = agent.handle("analysis.form", {"eventId": "E1", "lookback": 5})
+    assert first["data"] == second["data"]
+    assert len(calls) == n_first
+    assert all(t.get("cached") == "hit" for t in second["meta"]["trace"] if "cached" in t)
+
+
+def test_tally_scores_small_and_large_samples_agree():
+    pairs = [(2, 1), (0, 0), (1, 3)]
+    assert analysis_agent.tally_scores(pairs) == (1, 1, 1, 3, 4)
+    big = pairs * 50  # above the vectorization threshold
+    assert analysis_agent.tally_scores(big) == (50, 50, 50, 150, 200)
+
+
+def test_team_form_many_keeps_input_order():
+    agent = AnalysisAgent(all_sports_agent=FakeAllSports())
+    metrics, trace = agent.team_form_many(["T3", "T1", "T4"], lookback=5)
+    assert [m["games"] for m in metrics] == [3, 5, 3]
+    assert metrics[1]["wins"] == 2 and metrics[1]["draws"] == 2 and metrics[1]["losses"] == 1
+    assert len([t for t in trace if t.get("step") == "sports.fixtures.list"]) == 3
+
+
+def test_match_insights_form_fallback_reuses_form_section():
+    agent = AnalysisAgent(all_sports_agent=FakeAllSports())
+    r = agent.handle("analysis.match_insights", {"eventId": "E2"})  # no odds, no H2H rows
+    assert r["ok"] is True
+    assert r["data"]["winprob"]["method"] == "form_logistic"
+    assert r["data"]["winprob"]["inputs"]["home_metrics"] == r["data"]["form"]["home_metrics"]
+    assert {"step": "form", "reused": True} in r["meta"]["trace"]
@@ -0,0 +1,82 @@
+# tests/test_cache.py
+from __future__ import annotations
+
+import pytest
+
+from backend.app.utils import cache as cache_mod
+from backend.app.utils.cache import DiskCache, TTLCache, cached_call, make_key
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_mod.time, "time", lambda: now[0])
+    return now
+
+
+def test_make_key_is_stable_across_dict_order():
+    assert make_key("/x.php", {"a": 1, "b": "2"}) == make_key("/x.php", {"b": "2", "a": 1})
+    assert make_key("/x.php", {"a": 1}) != make_key("/y.php", {"a": 1})
+    assert isinstance(make_key("p", {1: "int key"}), bytes)
+
+
+def test_ttl_cache_expiry_and_stale_reads(clock):
+    c = TTLCache()
+    c.set(b"k", {"v": 1}, ttl=10)
+    assert c.get(b"k") == (True, {"v": 1})
+    clock[0] += 11
+    assert c.get(b"k") == (False, None)
+    assert c.get(b"k", allow_stale=True) == (True, {"v": 1})
+
+
+def test_ttl_cache_evicts_oldest_at_maxsize():
+    c = TTLCache(maxsize=2)
+    c.set(b"a", 1, ttl=60)
+    c.set(b"b", 2, ttl=60)
+    c.set(b"a", 10, ttl=60)  # overwrite does not evict
+    assert c.get(b"b") == (True, 2)
+    c.set(b"c", 3, ttl=60)
+    assert c.get(b"a") == (False, None)
+    assert c.get(b"b") == (True, 2) and c.get(b"c") == (True, 3)
+    c.clear()
+    assert c.get(b"c") == (False, None)
+
+
+def test_cached_call_hit_stale_and_bypass(clock):
+    c = TTLCache()
+    calls = []
+
+    def fetch(value):
+        def fn():
+            calls.append(value)
+            if isinstance(value, Exception):
+                raise value
+            return value
+        return fn
+
+    is_ok = lambda d: bool(d) and "error" not in d
+    assert cached_call(c, b"k", 10, fetch({"v": 1}), is_ok) == ({"v": 1}, None)
+    assert cached_call(c, b"k", 10, fetch({"v": 2}), is_ok) == ({"v": 1}, "hit")
+    clock[0] += 11
+    # rejected value and raised error both fall back to the expired entry
+    assert cached_call(c, b"k", 10, fetch({"error": "status_500"}), is_ok) == ({"v": 1}, "stale")
+    assert cached_call(c, b"k", 10, fetch(RuntimeError("boom")), is_ok) == ({"v": 1}, "stale")
+    with pytest.raises(RuntimeError):
+        cached_call(c, b"other", 10, fetch(RuntimeError("boom")), is_ok)
+    # ttl <= 0 never reads or writes the cache
+    assert cached_call(c, b"k", 0, fetch({"v": 3})) == ({"v": 3}, None)
+    assert len(calls) == 5  # the "hit" call never ran its fetch
+
+
+def test_disk_cache_round_trip_and_expiry(tmp_path, clock):
+    path = str(tmp_path / "tsdb.sqlite")
+    d = DiskCache(path)
+    d.set(b"k", {"leagues": [{"idLeague": "4328"}]}, ttl=60)
+    assert d.get(b"k") == (True, {"leagues": [{"idLeague": "4328"}]})
+    # survives a "restart"
+    assert DiskCache(path).get(b"k") == (True, {"leagues": [{"idLeague": "4328"}]})
+    clock[0] += 61
+    assert d.get(b"k") == (False, None)
+    assert d.get(b"k", allow_stale=True)[0] is True
+    d.clear()
+    assert d.get(b"k", allow_stale=True) == (False, None)
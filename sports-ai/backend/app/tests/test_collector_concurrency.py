@@ -0,0 +1,100 @@
+# tests/test_collector_concurrency.py
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from backend.app.agents import collector  # type: ignore
+
+N = 6
+
+
+def _run_together(fn, n=N):
+    """Call fn() from n threads released at once; returns the results/exceptions in thread order."""
+    barrier = threading.Barrier(n)
+    out = [None] * n
+
+    def worker(i):
+        barrier.wait()
+        try:
+            out[i] = fn()
+        except Exception as e:  # collected for the assertions
+            out[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=10)
+    return out
+
+
+def test_single_flight_runs_fn_once_for_concurrent_callers():
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.3)  # long enough for every other caller to join the in-flight call
+        return {"ok": 1}
+
+    results = _run_together(lambda: collector._single_flight(b"sf-ok", slow))
+    assert len(calls) == 1
+    assert all(r == {"ok": 1} for r in results)
+    assert b"sf-ok" not in collector._INFLIGHT
+
+
+def test_single_flight_exception_reaches_every_waiter():
+    calls = []
+
+    def boom():
+        calls.append(1)
+        time.sleep(0.3)
+        raise RuntimeError("upstream down")
+
+    results = _run_together(lambda: collector._single_flight(b"sf-err", boom))
+    assert len(calls) == 1
+    assert all(isinstance(r, RuntimeError) and str(r) == "upstream down" for r in results)
+    # the key is released, so the next call retries instead of replaying the error
+    assert collector._single_flight(b"sf-err", lambda: "recovered") == "recovered"
+
+
+@pytest.fixture
+def uncached_upstream(monkeypatch):
+    """Disable the TTL cache so only the in-flight dedup can merge calls; count upstream GETs."""
+    collector.clear_caches()
+    monkeypatch.setattr(collector, "TSDB_HTTP_TTL", 0.0)
+    monkeypatch.setattr(collector, "_RATE", collector.TokenBucket(0, 1))
+    monkeypatch.setattr(collector, "_FAILURES", collector.FailureBudget(0))
+    calls = []
+    yield calls, monkeypatch
+    collector.clear_caches()
+
+
+def test_handle_batch_identical_requests_share_one_get(uncached_upstream):
+    calls, monkeypatch = uncached_upstream
+
+    def get_json(path, params=None, **kw):
+        calls.append(path)
+        time.sleep(0.3)
+        return {"sports": [{"strSport": "Soccer"}]}
+
+    monkeypatch.setattr(collector, "get_json", get_json)
+    out = collector.CollectorAgentV2().handle_batch([{"intent": "sports.list", "args": {}}] * N)
+    assert calls == ["/all_sports.php"]
+    assert [r["data"] for r in out] == [{"sports": [{"strSport": "Soccer"}], "count": 1}] * N
+
+
+def test_handle_batch_upstream_exception_reaches_every_request(uncached_upstream):
+    calls, monkeypatch = uncached_upstream
+
+    def get_json(path, params=None, **kw):
+        calls.append(path)
+        time.sleep(0.3)
+        raise RuntimeError("connection reset")
+
+    monkeypatch.setattr(collector, "get_json", get_json)
+    out = collector.CollectorAgentV2().handle_batch([{"intent": "sports.list", "args": {}}] * N)
+    assert calls == ["/all_sports.php"]
+    assert all(not r["ok"] and "connection reset" in r["error"]["message"] for r in out)
@@ -0,0 +1,47 @@
+# tests/test_collector_fuzzy.py
+from __future__ import annotations
+
+import pytest
+
+from backend.app.agents import collector  # type: ignore
+
+NAMES = ["english premier league", "german bundesliga", "french ligue 1", "french ligue 2", "italian serie a"]
+
+
+@pytest.fixture(params=["stdlib", "rapidfuzz"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(collector, "_rf_process", None)
+    elif collector._rf_process is None:
+        pytest.skip("rapidfuzz not installed")
+    return request.param
+
+
+def test_indel_ratio_known_values():
+    assert collector._indel_ratio("", "") == 100.0
+    assert collector._indel_ratio("abc", "") == 0.0
+    assert collector._indel_ratio("bundesliag", "bundesliga") == 90.0
+
+
+def test_indel_ratio_matches_rapidfuzz():
+    fuzz = pytest.importorskip("rapidfuzz.fuzz")
+    for a, b in [("premer league", "premier league"), ("ligue 1", "ligue 2"), ("seria a", "serie a"), ("x", "abc")]:
+        assert collector._indel_ratio(a, b) == pytest.approx(fuzz.ratio(a, b))
+
+
+@pytest.mark.parametrize("needle, expected", [
+    ("english premer league", 0),
+    ("german bundesliag", 1),
+    ("italian seria b", None),
+    ("spanish la liga", None),
+])
+def test_fuzzy_pick_same_result_on_both_backends(backend, needle, expected):
+    hit = collector._fuzzy_pick(NAMES, needle)
+    assert (hit[0] if hit else None) == expected
+    if hit:
+        assert hit[1] >= collector._FUZZY_LEAGUE_CUTOFF
+
+
+def test_fuzzy_pick_tie_keeps_index_order(backend):
+    # equally close to "ligue 1" and "ligue 2": the earlier league wins on both backends
+    assert collector._fuzzy_pick(NAMES, "french ligue 3")[0] == 2
@@ -0,0 +1,196 @@
+# tests/test_collector_intents.py
+from __future__ import annotations
+
+import pytest
+
+from backend.app.agents import collector  # type: ignore
+
+
+class FakeHttp:
+    """Stands in for CollectorAgentV2._http: routes path -> payload (or callable(params))."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.calls = []
+
+    def __call__(self, path, params, trace):
+        self.calls.append((path, dict(params or {})))
+        trace.append({"step": "http_get", "path": path, "params": params})
+        route = self.routes.get(path, {})
+        return route(params) if callable(route) else route
+
+
+@pytest.fixture
+def agent_with(monkeypatch):
+    collector.clear_caches()
+
+    def make(routes):
+        agent = collector.CollectorAgentV2()
+        fake = FakeHttp(routes)
+        monkeypatch.setattr(agent, "_http", fake)
+        return agent, fake
+
+    yield make
+    collector.clear_caches()
+
+
+def test_players_multiget_dedups_normalizes_and_tolerates_failures(agent_with):
+    rosters = {"133604": {"player": [{"idPlayer": "1"}, {"idPlayer": "2"}]}, "133613": {"player": None}}
+    agent, fake = agent_with({
+        "/lookup_all_players.php": lambda p: rosters.get(p["id"], {"error": "status_500"}),
+    })
+    out = agent.handle({"intent": "players.multiget", "args": {"teamIds": [133604, "133604", " 133613 ", "999"]}})
+    assert out["ok"]
+    assert out["data"] == {"teams": {"133604": rosters["133604"]["player"], "133613": [], "999": []}, "count": 2}
+    assert out["args_resolved"] == {"teamIds": ["133604", "133613", "999"]}
+    assert sorted(p["id"] for _, p in fake.calls) == ["133604", "133613", "999"]
+
+
+def test_players_multiget_expands_a_league_by_name(agent_with):
+    agent, fake = agent_with({
+        "/lookupleague.php": {"leagues": [{"idLeague": "4328", "strLeague": "English Premier League"}]},
+        "/search_all_teams.php": {"teams": [{"idTeam": 1, "strTeam": "Arsenal"}, {"idTeam": "2", "strTeam": "Chelsea"}]},
+        # must not be used: it returns the wrong clubs for many league ids
+        "/lookup_all_teams.php": {"teams": [{"idTeam": "666", "strTeam": "Wrong FC"}]},
+        "/lookup_all_players.php": lambda p: {"player": [{"idPlayer": p["id"] + "0"}]},
+    })
+    out = agent.handle({"intent": "players.multiget", "args": {"leagueId": 4328}})
+    assert out["data"]["teams"] == {"1": [{"idPlayer": "10"}], "2": [{"idPlayer": "20"}]}
+    assert out["args_resolved"] == {"leagueName": "English Premier League", "leagueId": "4328", "teamIds": ["1", "2"]}
+    assert ("/search_all_teams.php", {"l": "English Premier League", "s": "Soccer"}) in fake.calls
+    assert not any(path == "/lookup_all_teams.php" for path, _ in fake.calls)
+
+
+@pytest.mark.parametrize("args, code", [({"teamIds": "1"}, "BAD_REQUEST"), ({"teamIds": []}, "BAD_REQUEST"), ({}, "MISSING_ARG")])
+def test_players_multiget_bad_args(agent_with, args, code):
+    agent, fake = agent_with({})
+    out = agent.handle({"intent": "players.multiget", "args": args})
+    assert not out["ok"] and out["error"]["code"] == code
+    assert fake.calls == []
+
+
+def test_events_multiget_dedups_names_and_fetches_expansions(agent_with):
+    finished = {"idEvent": 441613, "strEvent": "Arsenal vs Chelsea", "strStatus": "Match Finished", "dateEvent": "2024-01-01"}
+    searches = {"Arsenal vs Chelsea": {"event": [finished]}}
+    agent, fake = agent_with({
+        "/searchevents.php": lambda p: searches.get(p["e"], {"error": "status_500"}),
+        "/lookupeventstats.php": {"eventstats": [{"strStat": "Shots"}]},
+    })
+    out = agent.handle({"intent": "events.multiget", "args": {
+        "eventNames": ["Arsenal vs Chelsea", " Arsenal vs Chelsea ", "Broken", 7],
+        "expand": ["stats"],
+    }})
+    assert out["ok"]
+    events = out["data"]["events"]
+    assert list(events) == ["Arsenal vs Chelsea", "Broken"] and out["data"]["count"] == 2
+    assert events["Arsenal vs Chelsea"]["event"] is finished
+    assert events["Arsenal vs Chelsea"]["stats"] == [{"strStat": "Shots"}]
+    # a failed search leaves that entry without a pick instead of failing the batch
+    assert "event" not in events["Broken"] and events["Broken"]["candidates"] == []
+    assert [c for c in fake.calls if c[0] == "/lookupeventstats.php"] == [("/lookupeventstats.php", {"id": "441613"})]
+    assert sum(c[0] == "/searchevents.php" for c in fake.calls) == 2
+
+
+def test_events_multiget_requires_names(agent_with):
+    agent, _ = agent_with({})
+    out = agent.handle({"intent": "events.multiget", "args": {"eventNames": "Arsenal vs Chelsea"}})
+    assert not out["ok"] and out["error"]["code"] == "MISSING_ARG"
+
+
+def test_teams_resolve_uses_one_roster_per_league(agent_with):
+    roster = {"teams": [{"idTeam": 133604, "strTeam": "Arsenal"}, {"idTeam": "133610", "strTeam": "Chelsea"}]}
+    agent, fake = agent_with({
+        "/search_all_teams.php": lambda p: roster if p["l"] == "English Premier League" else {"error": "status_500"},
+        "/searchteams.php": {"teams": None},
+    })
+    out = agent.handle({"intent": "teams.resolve", "args": {"teams": [
+        {"teamName": "Arsenal", "leagueName": "English Premier League"},
+        {"teamName": " chelsea ", "leagueName": "english premier league "},
+        {"teamName": "Nowhere FC", "leagueName": "English Premier League"},
+        {"leagueName": "English Premier League"},
+    ]}})
+    assert out["ok"]
+    teams = out["data"]["teams"]
+    assert [t.get("teamId") for t in teams] == ["133604", "133610", None, None]
+    assert teams[2]["error"]["code"] == "NOT_FOUND"
+    assert teams[3]["error"]["code"] == "MISSING_ARG"
+    assert sum(c[0] == "/search_all_teams.php" for c in fake.calls) == 1
+    # roster hits seed the resolver cache: a later single lookup costs no GET
+    before = len(fake.calls)
+    assert agent._resolve_team_id("Arsenal", [], leagueName="English Premier League") == "133604"
+    assert len(fake.calls) == before
+
+
+@pytest.mark.parametrize("teams, code", [(None, "MISSING_ARG"), (["Arsenal"], "BAD_REQUEST"), ("Arsenal", "BAD_REQUEST")])
+def test_teams_resolve_rejects_malformed_teams(agent_with, teams, code):
+    agent, _ = agent_with({})
+    out = agent.handle({"intent": "teams.resolve", "args": {"teams": teams}})
+    assert not out["ok"] and out["error"]["code"] == code
+
+
+def test_teams_resolve_bad_entry_only_fails_that_entry(agent_with):
+    roster = {"teams": [{"idTeam": "133604", "strTeam": "Arsenal"}]}
+    agent, fake = agent_with({"/search_all_teams.php": roster})
+    out = agent.handle({"intent": "teams.resolve", "args": {"teams": [
+        {"teamName": "Arsenal", "leagueName": "English Premier League"},
+        {"teamName": "Chelsea", "leagueName": 39},
+        {"teamName": ["Spurs"]},
+    ]}})
+    assert out["ok"]
+    teams = out["data"]["teams"]
+    assert teams[0]["teamId"] == "133604"
+    assert teams[1]["error"]["code"] == teams[2]["error"]["code"] == "BAD_REQUEST"
+    assert fake.calls == [("/search_all_teams.php", {"l": "English Premier League", "s": "Soccer"})]
+
+
+EXPANSION_ROUTES = {
+    "/lookuptimeline.php": {"timeline": [{"strTimeline": "Goal"}]},
+    "/lookupeventstats.php": {"eventstats": [{"strStat": "Shots"}]},
+    "/lookuplineup.php": {"lineup": [{"strPlayer": "Saka"}]},
+    "/lookuptv.php": {"tvchannels": [{"strChannel": "BBC"}]},
+}
+
+
+@pytest.mark.parametrize("event, skipped", [
+    # stale "Not Started" on a played fixture: fetch everything, as the baseline did
+    ({"strStatus": "Not Started", "dateEvent": "2020-05-01"}, set()),
+    ({"strStatus": "NS", "dateEvent": "2020-05-01"}, set()),
+    ({"strStatus": "Match Finished", "dateEvent": "2020-05-01"}, set()),
+    ({"strStatus": "Postponed", "dateEvent": "2020-05-01"}, {"timeline", "stats", "lineup"}),
+    ({"strStatus": "Not Started", "dateEvent": "2999-01-01"}, {"timeline", "stats", "lineup"}),
+])
+def test_event_get_skips_expansions_only_for_future_or_called_off(agent_with, event, skipped):
+    event = {"idEvent": "1", "strEvent": "Arsenal vs Chelsea", **event}
+    agent, fake = agent_with({"/searchevents.php": {"event": [event]}, **EXPANSION_ROUTES})
+    out = agent.handle({"intent": "event.get", "args": {
+        "eventName": "Arsenal vs Chelsea", "expand": ["timeline", "stats", "lineup", "tv"],
+    }})
+    assert out["ok"]
+    data = out["data"]
+    for name in ("timeline", "stats", "lineup", "tv"):
+        assert bool(data[name]) is (name not in skipped), name
+    fetched = {path for path, _ in fake.calls}
+    assert ("/lookuptimeline.php" in fetched) is ("timeline" not in skipped)
+
+
+@pytest.mark.parametrize("intent, name_args", [
+    ("event.get", {"eventName": "Arsenal vs Chelsea"}),
+    ("events.multiget", {"eventNames": ["Arsenal vs Chelsea"]}),
+])
+def test_expand_accepts_comma_separated_string(agent_with, intent, name_args):
+    event = {"idEvent": "1", "strEvent": "Arsenal vs Chelsea", "strStatus": "Match Finished", "dateEvent": "2020-05-01"}
+    agent, fake = agent_with({"/searchevents.php": {"event": [event]}, **EXPANSION_ROUTES})
+    out = agent.handle({"intent": intent, "args": {**name_args, "expand": "timeline, stats"}})
+    assert out["ok"]
+    assert {path for path, _ in fake.calls} == {"/searchevents.php", "/lookuptimeline.php", "/lookupeventstats.php"}
+
+
+@pytest.mark.parametrize("intent, name_args", [
+    ("event.get", {"eventName": "Arsenal vs Chelsea"}),
+    ("events.multiget", {"eventNames": ["Arsenal vs Chelsea"]}),
+])
+def test_expand_rejects_non_string_items(agent_with, intent, name_args):
+    agent, fake = agent_with({})
+    out = agent.handle({"intent": intent, "args": {**name_args, "expand": [{"stats": True}]}})
+    assert not out["ok"] and out["error"]["code"] == "BAD_REQUEST"
+    assert fake.calls == []
@@ -0,0 +1,41 @@
+# tests/test_form.py
+from __future__ import annotations
+
+from backend.app.utils.form import _score, summarize_recent_form
+
+
+def test_direct_score_nonzero_counts_without_status():
+    assert _score({"home_score": "2", "away_score": 1}) == (2, 1, True)
+
+
+def test_direct_zero_zero_needs_finished_status():
+    assert _score({"home_score": 0, "away_score": 0}) == (0, 0, False)
+    assert _score({"home_score": 0, "away_score": 0, "status": "FT"}) == (0, 0, True)
+    # direct keys also look at match_status
+    assert _score({"goals_home": 0, "goals_away": 0, "match_status": "Finished"}) == (0, 0, True)
+
+
+def test_direct_negative_score_is_skipped():
+    assert _score({"home_score": -1, "away_score": 2}) == (0, 0, False)
+
+
+def test_nested_score_keeps_legacy_rules():
+    # nested shapes accept negatives and ignore match_status
+    assert _score({"score": {"home": -1, "away": 2}}) == (-1, 2, True)
+    assert _score({"score": {"home": 0, "away": 0}, "match_status": "FT"}) == (0, 0, False)
+    assert _score({"scores": {"localteam": 0, "visitorteam": 0}, "event_status": "After Pen."}) == (0, 0, True)
+
+
+def test_unparseable_values_fall_through():
+    assert _score({"home_score": "x", "away_score": 1, "score": {"home": 1, "away": 0}}) == (1, 0, True)
+
+
+def test_summarize_recent_form_skips_unplayed_rows():
+    fixtures = [
+        {"date": "2024-03-03", "home_id": "1", "home_score": 0, "away_score": 0},  # upcoming, no status
+        {"date": "2024-03-02", "home_id": "1", "home_score": 2, "away_score": 0},
+        {"date": "2024-03-01", "home_id": "9", "home_score": 1, "away_score": 1, "status": "FT"},
+    ]
+    rf = summarize_recent_form("1", fixtures)
+    assert (rf.matches, rf.wins, rf.draws, rf.losses) == (2, 1, 1, 0)
+    assert rf.last_five == ["W", "D"]
@@ -0,0 +1,103 @@
+# tests/test_rate_limit.py
+from __future__ import annotations
+
+import pytest
+
+from backend.app.utils import rate_limit as rl
+from backend.app.utils.rate_limit import FailureBudget, TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock; time.sleep advances it instead of blocking."""
+    now = [100.0]
+
+    def sleep(s):
+        now[0] += s
+
+    monkeypatch.setattr(rl.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(rl.time, "sleep", sleep)
+    return now
+
+
+def test_token_bucket_burst_then_paced(clock):
+    b = TokenBucket(rate=2.0, capacity=3)
+    assert [b.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert b.acquire() == pytest.approx(0.5)  # 4th call waits for one token at 2/s
+    assert b.acquire() == pytest.approx(0.5)
+
+
+def test_token_bucket_refills_up_to_capacity(clock):
+    b = TokenBucket(rate=2.0, capacity=3)
+    for _ in range(3):
+        b.acquire()
+    clock[0] += 60  # far longer than needed: refill caps at capacity
+    assert [b.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert b.acquire() > 0
+
+
+def test_token_bucket_rate_zero_disables(clock):
+    b = TokenBucket(rate=0, capacity=1)
+    assert all(b.acquire() == 0.0 for _ in range(100))
+
+
+def test_failure_budget_opens_after_n_failures_and_recovers(clock):
+    fb = FailureBudget(capacity=3, success_credit=0.5, refill_per_sec=0.2)
+    for _ in range(3):
+        assert fb.allow()
+        fb.record(False)
+    assert not fb.allow()
+    clock[0] += 4  # 0.8 tokens: still closed
+    assert not fb.allow()
+    clock[0] += 1  # 1.0 token: one probe may go out
+    assert fb.allow()
+
+
+def test_failure_budget_successes_earn_back_credit(clock):
+    fb = FailureBudget(capacity=2, success_credit=0.5, refill_per_sec=0.0)
+    fb.record(False)
+    fb.record(False)
+    assert not fb.allow()
+    fb.record(True)
+    fb.record(True)
+    assert fb.allow()
+    for _ in range(10):
+        fb.record(True)  # credit never exceeds capacity
+    fb.record(False)
+    fb.record(False)
+    assert not fb.allow()
+
+
+def test_failure_budget_zero_capacity_disables(clock):
+    fb = FailureBudget(capacity=0)
+    for _ in range(50):
+        fb.record(False)
+    assert fb.allow()
+
+
+def test_token_bucket_penalize_is_multiplicative_and_floored(clock):
+    b = TokenBucket(rate=4.0, capacity=10)
+    b.penalize()
+    assert b.rate == pytest.approx(3.0)
+    assert b.acquire() == pytest.approx(2 / 3.0)  # banked burst dropped: balance was pushed to -1
+    for _ in range(50):
+        b.penalize()
+    assert b.rate == pytest.approx(0.1)
+
+
+def test_token_bucket_reward_is_additive_and_capped(clock):
+    b = TokenBucket(rate=5.0, capacity=10)
+    b.penalize(factor=0.5)
+    assert b.rate == pytest.approx(2.5)
+    b.reward()
+    assert b.rate == pytest.approx(2.6)  # +2% of the configured 5/s
+    for _ in range(100):
+        b.reward()
+    assert b.rate == b.max_rate == 5.0
+
+
+def test_token_bucket_aimd_noop_when_disabled(clock):
+    b = TokenBucket(rate=0, capacity=1)
+    b.penalize()
+    b.reward()
+    assert b.rate == 0 and b.acquire() == 0.0
@@ -0,0 +1,112 @@
+"""Small in-process TTL cache for provider responses.
+
+Entries are stored as {"data", "exp"} like the AllSports countries/leagues caches.
+Expired entries are kept (until evicted) so callers can fall back to stale data
+when a refresh fails. DiskCache offers the same get/set contract on SQLite for
+reference data worth keeping across restarts.
+"""
+from __future__ import annotations
+import json, sqlite3, threading, time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+try:  # optional: several times faster than stdlib json for key building
+    import orjson
+except ImportError:  # pragma: no cover - fallback when library missing
+    orjson = None  # type: ignore[assignment]
+
+_ORJSON_KEY_OPTS = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+
+def make_key(*parts: Any) -> bytes:
+    """Stable key for a call signature (dict args are sorted)."""
+    if orjson is not None:
+        return orjson.dumps(parts, default=str, option=_ORJSON_KEY_OPTS)
+    return json.dumps(parts, sort_keys=True, default=str, separators=(",", ":")).encode()
+
+
+class TTLCache:
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._store: Dict[bytes, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes, *, allow_stale: bool = False) -> Tuple[bool, Any]:
+        """Return (hit, data). Expired entries only count as a hit with allow_stale."""
+        with self._lock:
+            entry = self._store.get(key)
+        if entry is None:
+            return False, None
+        if allow_stale or entry["exp"] > time.time():
+            return True, entry["data"]
+        return False, None
+
+    def set(self, key: bytes, data: Any, ttl: float) -> None:
+        with self._lock:
+            if key not in self._store and len(self._store) >= self.maxsize:
+                # dicts keep insertion order -> drop the oldest entry
+                self._store.pop(next(iter(self._store)), None)
+            self._store[key] = {"data": data, "exp": time.time() + ttl}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+
+
+class DiskCache:
+    """SQLite-backed key/value store with per-entry expiry, for data that should
+    survive a restart (reference lists that change on the order of days).
+
+    Same get/set contract as TTLCache; values must be JSON-serializable.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("CREATE TABLE IF NOT EXISTS cache (k BLOB PRIMARY KEY, v BLOB NOT NULL, exp REAL NOT NULL)")
+
+    def get(self, key: bytes, *, allow_stale: bool = False) -> Tuple[bool, Any]:
+        with self._lock:
+            row = self._db.execute("SELECT v, exp FROM cache WHERE k = ?", (key,)).fetchone()
+        if row is None or not (allow_stale or row[1] > time.time()):
+            return False, None
+        return True, (orjson.loads(row[0]) if orjson is not None else json.loads(row[0]))
+
+    def set(self, key: bytes, data: Any, ttl: float) -> None:
+        blob = orjson.dumps(data) if orjson is not None else json.dumps(data).encode()
+        with self._lock, self._db:
+            self._db.execute("INSERT OR REPLACE INTO cache (k, v, exp) VALUES (?, ?, ?)", (key, blob, time.time() + ttl))
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM cache")
+
+
+def cached_call(cache: TTLCache, key: bytes, ttl: float, fn: Callable[[], Any],
+                is_ok: Optional[Callable[[Any], bool]] = None) -> Tuple[Any, Optional[str]]:
+    """Return (value, cache_state) where cache_state is "hit", "stale" or None (fresh call).
+
+    Only values accepted by `is_ok` are stored. If the fresh call raises or yields
+    a rejected value, the last stored value is returned instead when available.
+    ttl <= 0 disables caching entirely.
+    """
+    if ttl <= 0:
+        return fn(), None
+    hit, data = cache.get(key)
+    if hit:
+        return data, "hit"
+    try:
+        data = fn()
+    except Exception:
+        hit, stale = cache.get(key, allow_stale=True)
+        if hit:
+            return stale, "stale"
+        raise
+    if is_ok is None or is_ok(data):
+        cache.set(key, data, ttl)
+        return data, None
+    hit, stale = cache.get(key, allow_stale=True)
+    if hit:
+        return stale, "stale"
+    return data, None
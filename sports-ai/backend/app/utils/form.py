@@ -1,9 +1,15 @@
 from __future__ import annotations
+import heapq
 from dataclasses import dataclass
 from typing import Dict, List, Tuple
 
+try:  # optional: only used to aggregate large samples
+    import numpy as np
+except ImportError:  # pragma: no cover - fallback when library missing
+    np = None  # type: ignore[assignment]
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class RecentFormSummary:
     team_id: str
     matches: int
@@ -16,61 +22,71 @@ class RecentFormSummary:
     unbeaten_streak: int
 
 
-_RESULT_KEYS = [
+_RESULT_KEYS = (
     ("home_score", "away_score"),
     ("goals_home", "goals_away"),
     ("homeGoals", "awayGoals"),
-]
+)
+# pairs looked up inside a nested fx["score"] / fx["scores"] object
+_NESTED_RESULT_KEYS = (
+    ("home", "away"),
+    ("localteam", "visitorteam"),
+)
+_FINISHED_TOKENS = ("ft", "full", "ended", "finished", "aet", "pen")
+
+_VECTORIZE_MIN_ROWS = 64  # below this, array setup costs more than the Python loop
+
+
+def tally_scores(pairs: List[Tuple[int, int]]) -> Tuple[int, int, int, int, int]:
+    """
+    Aggregate (goals_for, goals_against) pairs into (wins, draws, losses, gf, ga).
+    Uses NumPy masks for large samples when available.
+    """
+    if np is not None and len(pairs) >= _VECTORIZE_MIN_ROWS:
+        arr = np.asarray(pairs, dtype=np.int64)
+        f, a = arr[:, 0], arr[:, 1]
+        return int((f > a).sum()), int((f == a).sum()), int((f < a).sum()), int(f.sum()), int(a.sum())
+    wins = draws = losses = gf = ga = 0
+    for f, a in pairs:
+        gf += f
+        ga += a
+        if f > a:
+            wins += 1
+        elif f < a:
+            losses += 1
+        else:
+            draws += 1
+    return wins, draws, losses, gf, ga
+
+
+def _recency_key(fx: Dict):
+    return fx.get("timestamp") or fx.get("time") or fx.get("date") or 0
 
 
 def summarize_recent_form(team_id: str, fixtures: List[Dict], n: int = 5) -> RecentFormSummary:
-    fixtures_sorted = sorted(
-        fixtures,
-        key=lambda f: f.get("timestamp") or f.get("time") or f.get("date") or 0,
-        reverse=True,
-    )
-    picked = fixtures_sorted[:n * 2]  # over-pick to allow skipping non-completed rows
-    wins = draws = losses = 0
-    gf = ga = 0
-    last_labels: List[str] = []
-    unbeaten = 0
-    used = 0
+    # newest first; over-pick to allow skipping non-completed rows (top-k, no full sort)
+    picked = heapq.nlargest(n * 2, fixtures, key=_recency_key)
+    pairs: List[Tuple[int, int]] = []  # (our goals, their goals), newest first
 
     for fx in picked:
         # Skip fixtures without a real score (provider often sends upcoming games with 0-0 and no FT status)
         hs, as_, has_score = _score(fx)
         if not has_score:
             continue
-
-        is_home = _is_home_team(fx, team_id)
-        if is_home:
-            gf += hs
-            ga += as_
-            outcome = _outcome(hs, as_)
-        else:
-            gf += as_
-            ga += hs
-            outcome = _outcome(as_, hs)
-
-        last_labels.append(outcome)
-        used += 1
-        if outcome == "W":
-            wins += 1
-            unbeaten += 1
-        elif outcome == "D":
-            draws += 1
-            unbeaten += 1
-        else:
-            losses += 1
-            unbeaten = 0
-
+        pairs.append((hs, as_) if _is_home_team(fx, team_id) else (as_, hs))
         # stop once we have n completed matches
-        if used >= n:
+        if len(pairs) >= n:
             break
 
+    wins, draws, losses, gf, ga = tally_scores(pairs)
+    last_labels = [_outcome(our, opp) for our, opp in pairs]
+    unbeaten = 0
+    for label in last_labels:
+        unbeaten = 0 if label == "L" else unbeaten + 1
+
     return RecentFormSummary(
         team_id=str(team_id),
-        matches=used,
+        matches=len(pairs),
         wins=wins,
         draws=draws,
         losses=losses,
@@ -104,38 +120,42 @@ def _score(fx: Dict) -> Tuple[int, int, bool]:
     Return (home_score, away_score, has_score).
     has_score is True only if provider supplied concrete numbers and the match is likely completed.
     """
+    get = fx.get
     # direct numeric keys
     for hk, ak in _RESULT_KEYS:
-        h, a = fx.get(hk), fx.get(ak)
-        if h is not None and a is not None:
-            try:
-                hi, ai = int(h), int(a)
-                # consider it a real score if non-negative and at least one of: nonzero OR explicit finished status
-                if hi >= 0 and ai >= 0:
-                    status = str(fx.get("event_status") or fx.get("status") or fx.get("match_status") or "").lower()
-                    finished = any(tok in status for tok in ("ft", "full", "ended", "finished", "aet", "pen"))
-                    if (hi + ai) > 0 or finished:
-                        return hi, ai, True
-            except Exception:
-                pass
-
-    # nested shapes like score/home, score/away
-    score = fx.get("score") or fx.get("scores") or {}
-    for pair in [("home", "away"), ("localteam", "visitorteam")]:
-        h, a = score.get(pair[0]), score.get(pair[1])
-        if h is not None and a is not None:
-            try:
-                hi, ai = int(h), int(a)
-                status = str(fx.get("event_status") or fx.get("status") or "").lower()
-                finished = any(tok in status for tok in ("ft", "full", "ended", "finished", "aet", "pen"))
-                if (hi + ai) > 0 or finished:
-                    return hi, ai, True
-            except Exception:
-                pass
+        h, a = get(hk), get(ak)
+        if h is None or a is None:
+            continue
+        try:
+            hi, ai = int(h), int(a)
+        except Exception:
+            continue
+        # consider it a real score if non-negative and at least one of: nonzero OR explicit finished status
+        if hi >= 0 and ai >= 0:
+            if (hi + ai) > 0 or _is_finished(get("event_status") or get("status") or get("match_status")):
+                return hi, ai, True
+
+    # nested shapes like score/home, score/away (no sign check and no match_status here)
+    score = get("score") or get("scores") or {}
+    for hk, ak in _NESTED_RESULT_KEYS:
+        h, a = score.get(hk), score.get(ak)
+        if h is None or a is None:
+            continue
+        try:
+            hi, ai = int(h), int(a)
+        except Exception:
+            continue
+        if (hi + ai) > 0 or _is_finished(get("event_status") or get("status")):
+            return hi, ai, True
 
     return 0, 0, False
 
 
+def _is_finished(status) -> bool:
+    status = str(status or "").lower()
+    return any(tok in status for tok in _FINISHED_TOKENS)
+
+
 def _outcome(our: int, opp: int) -> str:
     if our > opp:
         return "W"
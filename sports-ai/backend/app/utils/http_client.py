@@ -2,33 +2,113 @@
 
 Provides get_json(path, params) used by CollectorAgentV2.
 Auto-injects the base URL and API key (public test key by default).
+Requests go through one pooled client so keep-alive connections are reused; when
+httpx's HTTP/2 extra (h2) is installed, concurrent calls are multiplexed over a
+single TLS connection instead (TSDB_HTTP2=0 forces the requests Session).
 """
 from __future__ import annotations
 import os, requests
-from typing import Any, Dict
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Tuple, Union
+from urllib3.util.retry import Retry
+
+try:  # optional: HTTP/2 multiplexing for the concurrent collector fan-out
+    if os.getenv("TSDB_HTTP2", "1").strip() in ("0", "false", "no"):
+        raise ImportError("HTTP/2 disabled via TSDB_HTTP2")
+    import httpx
+    import h2  # noqa: F401  (httpx needs it for http2=True)
+except ImportError:  # pragma: no cover - fallback when library missing
+    httpx = None  # type: ignore[assignment]
+
+try:  # optional: decodes large payloads (season events, league rosters) several times faster
+    import orjson
+except ImportError:  # pragma: no cover - fallback when library missing
+    orjson = None  # type: ignore[assignment]
+
+try:  # optional: lets urllib3/httpx decode brotli, which compresses the repetitive JSON further
+    import brotli  # noqa: F401
+except ImportError:  # pragma: no cover - fallback when library missing
+    brotli = None  # type: ignore[assignment]
 
 # Public demo key (TheSportsDB) can be overridden with environment variable.
 THESPORTSDB_API_KEY = os.getenv("THESPORTSDB_API_KEY", "3").strip()
 BASE_URL = f"https://www.thesportsdb.com/api/v1/json/{THESPORTSDB_API_KEY}"
 
-def get_json(path: str, params: Dict[str, Any] | None = None, timeout: int = 15) -> Dict[str, Any]:
+# Only advertise br when it can be decoded; the server answers in the first listed encoding it supports.
+HEADERS = {
+    "Accept-Encoding": "br, gzip" if brotli is not None else "gzip, deflate",
+    "User-Agent": "sports-ai-collector/1.0",
+}
+
+# Shared keep-alive pool: avoids a fresh TCP/TLS handshake per call. Sized above the
+# collector's worker pool; retries only cover connection-level failures.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=32,
+    # read=0: a timed-out read is not retried, so a slow upstream costs one timeout, not four
+    max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3, allowed_methods=frozenset({"GET"})),
+))
+
+H2_CLIENT = (
+    httpx.Client(
+        http2=True,
+        headers=HEADERS,
+        # limits must sit on the transport: httpx.Client ignores its own when given one
+        transport=httpx.HTTPTransport(
+            http2=True,
+            retries=3,  # retries connection failures only
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        ),
+    )
+    if httpx is not None
+    else None
+)
+
+# (connect, read): a dead host fails in ~3 s instead of tying up a pooled slot for
+# the full read budget; slow but healthy responses still get 15 s.
+DEFAULT_TIMEOUT: Tuple[float, float] = (3.05, 15.0)
+
+def get_json(
+    path: str,
+    params: Dict[str, Any] | None = None,
+    timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+) -> Dict[str, Any]:
     """Perform a GET request to TheSportsDB and return JSON (or {}).
 
     path: may start with '/' or be relative. Example: '/eventsday.php'
     params: query string dict (optional)
-    timeout: request timeout seconds
+    timeout: seconds, or a (connect, read) tuple
     """
     if not path:
         return {}
     url = BASE_URL + (path if path.startswith('/') else '/' + path)
+    if H2_CLIENT is not None:
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        try:
+            resp = H2_CLIENT.get(url, params=params or {}, timeout=httpx.Timeout(read, connect=connect))
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+        return _decode(resp)
     try:
-        resp = requests.get(url, params=params or {}, timeout=timeout)
-        if resp.status_code == 200:
-            try:
-                return resp.json() or {}
-            except Exception:
-                return {}
-        # Non-200 -> return minimal structure so caller can handle gracefully
-        return {"error": f"status_{resp.status_code}"}
+        resp = SESSION.get(url, params=params or {}, timeout=timeout)
     except requests.RequestException as e:
         return {"error": str(e)}
+    return _decode(resp)
+
+
+def _decode(resp: Any) -> Dict[str, Any]:
+    """JSON body of a requests/httpx response ({} if not JSON, {"error": ...} if non-200)."""
+    if resp.status_code == 200:
+        try:
+            if orjson is not None:
+                try:
+                    return orjson.loads(resp.content) or {}
+                except orjson.JSONDecodeError:
+                    pass  # non-UTF-8 or odd body: let the client sniff the encoding
+            return resp.json() or {}
+        except Exception:
+            return {}
+    # Non-200 -> return minimal structure so caller can handle gracefully
+    return {"error": f"status_{resp.status_code}"}
@@ -0,0 +1,89 @@
+"""Thread-safe token buckets for outbound provider calls.
+
+TokenBucket paces requests: unlike a fixed sleep after every request, it only
+waits once the burst allowance is spent, so occasional calls go straight through
+while bulk loops are held to the configured average rate. On a 429 the caller can
+penalize() the bucket (multiplicative decrease, queue pushed back) and reward() it
+on success (additive increase back up to the configured rate).
+
+FailureBudget stops calls when the upstream is failing: each failure spends a
+token and each success earns back a fraction, so when the budget runs out callers
+fail fast instead of queueing on timeouts. Time refills it slowly so probes resume.
+"""
+from __future__ import annotations
+import threading, time
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float) -> None:
+        """rate: tokens added per second (<= 0 disables limiting); capacity: max burst."""
+        self.rate = rate
+        self.max_rate = rate
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available. Returns seconds waited."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            self._tokens -= 1.0
+            # A negative balance is this caller's reserved place in the queue.
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, factor: float = 0.75, min_rate: float = 0.1) -> None:
+        """Upstream throttled us: cut the rate and drop any banked burst."""
+        if self.rate <= 0:
+            return
+        with self._lock:
+            self.rate = max(min(min_rate, self.max_rate), self.rate * factor)
+            self._tokens = min(self._tokens, -1.0)
+
+    def reward(self, step_fraction: float = 0.02) -> None:
+        """Successful call: creep back towards the configured rate."""
+        if self.rate <= 0 or self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * step_fraction)
+
+
+class FailureBudget:
+    def __init__(self, capacity: float, success_credit: float = 0.1, refill_per_sec: float = 0.2) -> None:
+        """capacity: failures tolerated back-to-back (<= 0 disables the budget)."""
+        self.capacity = capacity
+        self.success_credit = success_credit
+        self.refill_per_sec = refill_per_sec
+        self._tokens = max(capacity, 0.0)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.refill_per_sec)
+        self._stamp = now
+
+    def allow(self) -> bool:
+        """True if a call may go out (at least one failure's worth of budget left)."""
+        if self.capacity <= 0:
+            return True
+        with self._lock:
+            self._refill()
+            return self._tokens >= 1.0
+
+    def record(self, ok: bool) -> None:
+        if self.capacity <= 0:
+            return
+        with self._lock:
+            self._refill()
+            if ok:
+                self._tokens = min(self.capacity, self._tokens + self.success_credit)
+            else:
+                self._tokens = max(0.0, self._tokens - 1.0)